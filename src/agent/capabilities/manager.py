@@ -1,11 +1,18 @@
-from collections.abc import Awaitable, Callable
+import inspect
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from functools import wraps
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 import structlog
 from a2a.types import Task
 
-from agent.config import Config
+from agent.config import Config, get_plugin_resolver
 from agent.middleware import with_middleware
+from agent.middleware.implementation import get_global_cache_config
+from agent.security.context import create_capability_context, get_current_auth, log_capability_access
+from agent.state.decorators import with_state
 
 if TYPE_CHECKING:
     from agent.core.models.iteration import FunctionExecutionResult
@@ -16,8 +23,71 @@ _project_name = Config.project_name
 
 logger = structlog.get_logger(__name__)
 
+# Values derived from the capability registry, invalidated whenever the registry changes
+_capabilities_listing_cache: str | None = None
+_sorted_capability_ids: tuple[str, ...] | None = None
+
+
+class _CapabilityRegistry(dict):
+    # Dict that drops values derived from its contents whenever capabilities are added or removed
+
+    __slots__ = ()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        _invalidate_derived_caches()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        _invalidate_derived_caches()
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        _invalidate_derived_caches()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        _invalidate_derived_caches()
+        return item
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        _invalidate_derived_caches()
+        return value
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        _invalidate_derived_caches()
+
+    def __ior__(self, other):
+        super().__ior__(other)
+        _invalidate_derived_caches()
+        return self
+
+    def clear(self):
+        super().clear()
+        _invalidate_derived_caches()
+
+
+def _invalidate_derived_caches() -> None:
+    global _capabilities_listing_cache, _sorted_capability_ids
+    _capabilities_listing_cache = None
+    _sorted_capability_ids = None
+
+
+def _get_sorted_capability_ids() -> tuple[str, ...]:
+    global _sorted_capability_ids
+    if _sorted_capability_ids is None:
+        _sorted_capability_ids = tuple(sorted(_capabilities))
+    return _sorted_capability_ids
+
+
 # Capability registry - unified for all capability executors
-_capabilities: dict[str, Callable[[Task], str] | Callable[[Task], Awaitable[str]]] = {}
+_capabilities: dict[str, Callable[[Task], str] | Callable[[Task], Awaitable[str]]] = _CapabilityRegistry()
+
+# Read-only live view of the capability registry handed out to callers
+_capabilities_view = MappingProxyType(_capabilities)
 
 # MCP capability tracking - stores metadata about MCP tools registered as capabilities
 _mcp_capabilities: dict[str, "MCPCapabilityInfo"] = {}
@@ -135,16 +205,12 @@ def register_plugin_capability(plugin_config: dict[str, Any]) -> None:
     Args:
         plugin_config: Dictionary containing capability_id and required_scopes
     """
-    from agent.security.context import create_capability_context
-
     capability_id = plugin_config["capability_id"]
-    required_scopes = plugin_config.get("required_scopes", [])
+    required_scopes = frozenset(plugin_config.get("required_scopes", []))
 
     # Get plugin's base executor from the plugin system
     try:
-        from agent.plugins.integration import get_plugin_adapter
-
-        plugin_adapter = get_plugin_adapter()
+        plugin_adapter = _get_plugin_adapter()
         if not plugin_adapter:
             logger.error(f"No plugin adapter available for capability: {capability_id}")
             return
@@ -160,91 +226,69 @@ def register_plugin_capability(plugin_config: dict[str, Any]) -> None:
 
     # Framework wraps with scope enforcement
     async def scope_enforced_executor(task: Task, context=None) -> str:
-        import time
-
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         # Create capability context if not provided
         if context is None:
-            from agent.security.context import get_current_auth
-
             auth_result = get_current_auth()
             context = create_capability_context(task, auth_result)
 
         # Resolve effective scopes using the plugin resolver if available
         effective_scopes = required_scopes
         try:
-            from agent.config import get_plugin_resolver
-
             resolver = get_plugin_resolver()
             if resolver:
-                # Get the actual plugin name that provides this capability
-                plugin_name = capability_id  # Default fallback
-                try:
-                    capability_info = plugin_adapter.get_capability_info(capability_id)
-                    if capability_info and "plugin_name" in capability_info:
-                        plugin_name = capability_info["plugin_name"]
-                except (KeyError, AttributeError, TypeError, ImportError):
-                    # Plugin adapter or capability info not available - use fallback
-                    pass
+                plugin_name = _resolve_plugin_name(capability_id)
 
                 # Get effective scopes from the resolver
-                effective_scopes = resolver.get_effective_scopes(plugin_name, capability_id, required_scopes)
-                logger.debug(f"Using plugin resolver for effective scopes: {effective_scopes}")
+                effective_scopes = frozenset(
+                    resolver.get_effective_scopes(plugin_name, capability_id, sorted(required_scopes))
+                )
+                logger.debug(f"Using plugin resolver for effective scopes: {sorted(effective_scopes)}")
             else:
-                logger.debug(f"Plugin resolver not available, using decorator scopes: {required_scopes}")
+                logger.debug(f"Plugin resolver not available, using decorator scopes: {sorted(required_scopes)}")
 
         except Exception as e:
             logger.debug(f"Error getting effective scopes, using decorator scopes: {e}")
             effective_scopes = required_scopes
 
-        # Check scope access with comprehensive audit logging
-        access_granted = True
-        for scope in effective_scopes:
-            if not context.has_scope(scope):
-                access_granted = False
-                break
-
-        # Comprehensive audit logging
-        from agent.security.context import log_capability_access
-
-        log_capability_access(
-            capability_id=capability_id,
-            user_id=context.user_id or "anonymous",
-            user_scopes=context.user_scopes,
-            required_scopes=effective_scopes,
-            success=access_granted,
-        )
+        # Check scope access
+        has_scope = context.has_scope
+        access_granted = all(has_scope(scope) for scope in effective_scopes)
 
         # Framework enforces what plugin declared
         if not access_granted:
+            log_capability_access(
+                capability_id=capability_id,
+                user_id=context.user_id or "anonymous",
+                user_scopes=context.user_scopes,
+                required_scopes=effective_scopes,
+                success=False,
+            )
             raise PermissionError("Insufficient permissions")
 
         # Only execute if scopes pass
         try:
-            result = await base_executor(task)
-
-            # Log execution time
-            execution_time = int((time.time() - start_time) * 1000)
+            return await base_executor(task)
+        except Exception as e:
+            logger.error(f"Capability execution failed: {capability_id} - {e}")
+            raise
+        finally:
+            # Single audit record for granted access, including execution time
             log_capability_access(
                 capability_id=capability_id,
                 user_id=context.user_id or "anonymous",
                 user_scopes=context.user_scopes,
                 required_scopes=effective_scopes,
                 success=True,
-                execution_time_ms=execution_time,
+                execution_time_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
             )
 
-            return result
-        except Exception as e:
-            logger.error(f"Capability execution failed: {capability_id} - {e}")
-            raise
-
     # Register the wrapped executor
     try:
         register_capability_function(capability_id, scope_enforced_executor)
         logger.debug(
-            f"Registered plugin capability with scope enforcement: {capability_id} (scopes: {required_scopes})"
+            f"Registered plugin capability with scope enforcement: {capability_id} (scopes: {sorted(required_scopes)})"
         )
     except Exception as e:
         logger.error(f"Failed to register plugin capability: {capability_id} - {e}")
@@ -267,38 +311,29 @@ async def register_mcp_tool_as_capability(
         mcp_client: MCP client instance to call the tool
         tool_scopes: List of required scopes for this tool
     """
-    from agent.security.context import create_capability_context, get_current_auth
+    required_scopes = frozenset(tool_scopes)
 
     async def mcp_tool_executor(task: Task, context=None) -> str:
-        import time
-
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         # Create capability context if not provided
         if context is None:
             auth_result = get_current_auth()
             context = create_capability_context(task, auth_result)
 
-        # Check scope access with comprehensive audit logging
-        access_granted = True
-        for scope in tool_scopes:
-            if not context.has_scope(scope):
-                access_granted = False
-                break
-
-        # Comprehensive audit logging for MCP tools
-        from agent.security.context import log_capability_access
-
-        log_capability_access(
-            capability_id=f"mcp:{tool_name}",
-            user_id=context.user_id or "anonymous",
-            user_scopes=context.user_scopes,
-            required_scopes=tool_scopes,
-            success=access_granted,
-        )
+        # Check scope access
+        has_scope = context.has_scope
+        access_granted = all(has_scope(scope) for scope in required_scopes)
 
         # Framework enforces scopes for MCP tools
         if not access_granted:
+            log_capability_access(
+                capability_id=f"mcp:{tool_name}",
+                user_id=context.user_id or "anonymous",
+                user_scopes=context.user_scopes,
+                required_scopes=required_scopes,
+                success=False,
+            )
             raise PermissionError("Insufficient permissions")
 
         # Extract parameters from task
@@ -309,23 +344,21 @@ async def register_mcp_tool_as_capability(
         try:
             # Call external MCP tool
             result = await mcp_client.call_tool(tool_name, params)
-
-            # Log successful execution with timing
-            execution_time = int((time.time() - start_time) * 1000)
+            return str(result)
+        except Exception as e:
+            logger.error(f"MCP tool execution failed: {tool_name} - {e}")
+            raise
+        finally:
+            # Single audit record for granted access, including execution time
             log_capability_access(
                 capability_id=f"mcp:{tool_name}",
                 user_id=context.user_id or "anonymous",
                 user_scopes=context.user_scopes,
-                required_scopes=tool_scopes,
+                required_scopes=required_scopes,
                 success=True,
-                execution_time_ms=execution_time,
+                execution_time_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
             )
 
-            return str(result)
-        except Exception as e:
-            logger.error(f"MCP tool execution failed: {tool_name} - {e}")
-            raise
-
     # Register like any other capability
     register_capability_function(tool_name, mcp_tool_executor)
 
@@ -359,12 +392,57 @@ async def register_mcp_tool_as_capability(
 
 # Middleware configuration cache
 _middleware_config: list[dict[str, Any]] | None = None
+_global_middleware_decorator: Callable[[Callable], Callable] | None = None
 _global_middleware_applied = False
 
 # State management configuration cache
 _state_config: dict[str, Any] | None = None
 _global_state_applied = False
 
+# Plugin configuration index (plugin name/package -> config dict) and resolved capability plugin names
+_plugin_config_index: dict[str, dict] | None = None
+_plugin_name_cache: dict[str, str] = {}
+
+# Override keys present in any plugin config, so capabilities can skip plugin lookups when none exist
+_plugin_override_keys: frozenset[str] = frozenset()
+_MIDDLEWARE_OVERRIDE_KEYS = frozenset({"plugin_override", "middleware_override"})
+_STATE_OVERRIDE_KEYS = frozenset({"state_override"})
+
+
+# Translation of the dictionary middleware config into the list format expected by with_middleware:
+# (config section, middleware name, ((param name, config key, default), ...))
+_MIDDLEWARE_CONFIG_MAP: tuple[tuple[str, str, tuple[tuple[str, str, Any], ...]], ...] = (
+    (
+        "rate_limiting",
+        "rate_limited",
+        (("requests_per_minute", "requests_per_minute", 60), ("burst_limit", "burst_size", None)),
+    ),
+    (
+        "caching",
+        "cached",
+        (("backend_type", "backend", "memory"), ("default_ttl", "default_ttl", 300), ("max_size", "max_size", 1000)),
+    ),
+    (
+        "retry",
+        "retryable",
+        (
+            ("max_attempts", "max_attempts", 3),
+            ("backoff_factor", "initial_delay", 1.0),
+            ("max_delay", "max_delay", 60.0),
+        ),
+    ),
+)
+
+
+def _shared_cache_params() -> dict[str, Any]:
+    shared_cache_config = get_global_cache_config()
+    return {
+        "backend_type": shared_cache_config.backend_type,
+        "default_ttl": shared_cache_config.default_ttl,
+        "max_size": shared_cache_config.max_size,
+        "key_prefix": shared_cache_config.key_prefix,
+    }
+
 
 def _load_middleware_config() -> list[dict[str, Any]]:
     global _middleware_config
@@ -380,71 +458,26 @@ def _load_middleware_config() -> list[dict[str, Any]]:
             # Convert new dictionary format to list format expected by with_middleware
             _middleware_config = []
 
-            if isinstance(middleware_config, dict):
-                # Check if middleware is enabled
-                if not middleware_config.get("enabled", True):
-                    _middleware_config = []
-                else:
-                    # Convert rate_limiting config
-                    if middleware_config.get("rate_limiting", {}).get("enabled", False):
-                        rate_config = middleware_config["rate_limiting"]
-                        _middleware_config.append(
-                            {
-                                "name": "rate_limited",
-                                "params": {
-                                    "requests_per_minute": rate_config.get("requests_per_minute", 60),
-                                    "burst_limit": rate_config.get("burst_size", None),
-                                },
-                            }
-                        )
-
-                    # Convert caching config - use shared global cache config
-                    if middleware_config.get("caching", {}).get("enabled", False):
-                        # Import and use the global cache configuration
+            # Check if middleware is enabled
+            if isinstance(middleware_config, dict) and middleware_config.get("enabled", True):
+                for section, name, param_map in _MIDDLEWARE_CONFIG_MAP:
+                    section_config = middleware_config.get(section)
+                    if not section_config or not section_config.get("enabled", False):
+                        continue
+
+                    params = None
+                    if section == "caching":
+                        # Use shared global cache config, falling back to the local section
                         try:
-                            from agent.middleware.implementation import get_global_cache_config
-
-                            shared_cache_config = get_global_cache_config()
-
-                            _middleware_config.append(
-                                {
-                                    "name": "cached",
-                                    "params": {
-                                        "backend_type": shared_cache_config.backend_type,
-                                        "default_ttl": shared_cache_config.default_ttl,
-                                        "max_size": shared_cache_config.max_size,
-                                        "key_prefix": shared_cache_config.key_prefix,
-                                    },
-                                }
-                            )
+                            params = _shared_cache_params()
                         except Exception as e:
                             logger.warning(f"Could not use global cache config, falling back to local config: {e}")
-                            # Fallback to original behavior
-                            cache_config = middleware_config["caching"]
-                            _middleware_config.append(
-                                {
-                                    "name": "cached",
-                                    "params": {
-                                        "backend_type": cache_config.get("backend", "memory"),
-                                        "default_ttl": cache_config.get("default_ttl", 300),
-                                        "max_size": cache_config.get("max_size", 1000),
-                                    },
-                                }
-                            )
-
-                    # Convert retry config
-                    if middleware_config.get("retry", {}).get("enabled", False):
-                        retry_config = middleware_config["retry"]
-                        _middleware_config.append(
-                            {
-                                "name": "retryable",
-                                "params": {
-                                    "max_attempts": retry_config.get("max_attempts", 3),
-                                    "backoff_factor": retry_config.get("initial_delay", 1.0),
-                                    "max_delay": retry_config.get("max_delay", 60.0),
-                                },
-                            }
-                        )
+
+                    if params is None:
+                        params = {param: section_config.get(key, default) for param, key, default in param_map}
+
+                    _middleware_config.append({"name": name, "params": params})
+
         if not _middleware_config:
             logger.debug("No middleware configured for capability")
         else:
@@ -463,8 +496,6 @@ def _load_state_config() -> dict[str, Any]:
         return _state_config
 
     try:
-        from agent.config import Config
-
         _state_config = Config.state_management
         if isinstance(_state_config, dict):
             logger.debug(f"Loaded state config: {_state_config}")
@@ -478,31 +509,85 @@ def _load_state_config() -> dict[str, Any]:
         return _state_config
 
 
-def _get_plugin_config(plugin_name: str) -> dict | None:
-    try:
-        from agent.config import Config
+def _load_plugin_config_index() -> dict[str, dict]:
+    global _plugin_config_index, _plugin_override_keys
+    if _plugin_config_index is not None:
+        return _plugin_config_index
 
+    index: dict[str, dict] = {}
+    try:
         # Handle new dictionary-based plugin structure
         if hasattr(Config, "plugins") and isinstance(Config.plugins, dict):
             # New structure: plugins is a dict with package names as keys
-            plugin_config = Config.plugins.get(plugin_name)
-            if plugin_config:
-                return plugin_config.model_dump() if hasattr(plugin_config, "model_dump") else dict(plugin_config)
+            for package_name, plugin_config in Config.plugins.items():
+                if plugin_config:
+                    index[package_name] = (
+                        plugin_config.model_dump() if hasattr(plugin_config, "model_dump") else dict(plugin_config)
+                    )
         else:
             # Fallback: old list structure with name or package fields
             for plugin in getattr(Config, "plugins", []):
-                # Try to match by name or package field
                 plugin_dict = plugin.model_dump() if hasattr(plugin, "model_dump") else dict(plugin)
-                if plugin_dict.get("name") == plugin_name or plugin_dict.get("package") == plugin_name:
-                    return plugin_dict
-        return None
+                # Index by name or package field, first match wins as in a linear scan
+                for key in (plugin_dict.get("name"), plugin_dict.get("package")):
+                    if key:
+                        index.setdefault(key, plugin_dict)
+    except Exception as e:
+        logger.debug(f"Could not load plugin configs: {e}")
+
+    _plugin_config_index = index
+    _plugin_override_keys = frozenset(
+        key
+        for plugin_dict in index.values()
+        for key in (*_MIDDLEWARE_OVERRIDE_KEYS, *_STATE_OVERRIDE_KEYS)
+        if key in plugin_dict
+    )
+    return _plugin_config_index
+
+
+def _has_plugin_overrides(override_keys: frozenset[str]) -> bool:
+    _load_plugin_config_index()
+    return not override_keys.isdisjoint(_plugin_override_keys)
+
+
+def _get_plugin_config(plugin_name: str) -> dict | None:
+    return _load_plugin_config_index().get(plugin_name)
+
+
+def _get_plugin_adapter():
+    # Imported lazily: agent.plugins.integration imports this module
+    from agent.plugins.integration import get_plugin_adapter
+
+    return get_plugin_adapter()
+
+
+def _resolve_plugin_name(capability_id: str) -> str:
+    plugin_name = _plugin_name_cache.get(capability_id)
+    if plugin_name is not None:
+        return plugin_name
+
+    # Get the actual plugin name that provides this capability
+    try:
+        adapter = _get_plugin_adapter()
+        if adapter:
+            capability_info = adapter.get_capability_info(capability_id)
+            if capability_info and "plugin_name" in capability_info:
+                plugin_name = capability_info["plugin_name"]
+                # Only cache real resolutions so a late-loading adapter is still picked up
+                _plugin_name_cache[capability_id] = plugin_name
+                logger.debug(f"Resolved capability '{capability_id}' to plugin '{plugin_name}'")
+                return plugin_name
     except Exception as e:
-        logger.debug(f"Could not load plugin config for '{plugin_name}': {e}")
-        return None
+        logger.debug(f"Could not resolve plugin name for capability '{capability_id}': {e}")
+
+    return capability_id  # Default fallback
 
 
 def _resolve_state_config(plugin_name: str) -> dict:
     global_state_config = _load_state_config()
+    if not _has_plugin_overrides(_STATE_OVERRIDE_KEYS):
+        return global_state_config
+
     plugin_config = _get_plugin_config(plugin_name)
 
     if plugin_config and "state_override" in plugin_config:
@@ -513,9 +598,11 @@ def _resolve_state_config(plugin_name: str) -> dict:
 
 
 def _apply_auth_to_capability(executor: Callable, capability_id: str) -> Callable:
-    from functools import wraps
-
-    from agent.security.context import create_capability_context, get_current_auth
+    # Check once at wrap time whether the executor accepts a context parameter
+    accepts_context = len(inspect.signature(executor).parameters) > 1
+    if not accepts_context:
+        # Legacy executor - it only takes the task, so there is no context to build
+        return executor
 
     @wraps(executor)
     async def auth_wrapped_executor(task):
@@ -524,32 +611,22 @@ def _apply_auth_to_capability(executor: Callable, capability_id: str) -> Callabl
 
         # Create capability context with authentication info
         capability_context = create_capability_context(task, auth_result)
-
-        # Check if executor accepts context parameter
-        import inspect
-
-        sig = inspect.signature(executor)
-
-        if len(sig.parameters) > 1:
-            # Executor accepts context parameter
-            return await executor(task, capability_context)
-        else:
-            # Legacy executor - just pass task
-            return await executor(task)
+        return await executor(task, capability_context)
 
     return auth_wrapped_executor
 
 
-def _apply_state_to_capability(executor: Callable, capability_id: str) -> Callable:
-    state_config = _resolve_state_config(capability_id)
+def _apply_state_to_capability(
+    executor: Callable, capability_id: str, state_config: dict[str, Any] | None = None
+) -> Callable:
+    if state_config is None:
+        state_config = _resolve_state_config(capability_id)
 
     if not state_config.get("enabled", False):
         logger.debug(f"State management disabled for {capability_id}")
         return executor
 
     try:
-        from agent.state.decorators import with_state
-
         # Mark the capability as having state applied in global registry
         _capabilities_with_state.add(capability_id)
         wrapped_executor = with_state([state_config])(executor)
@@ -564,23 +641,9 @@ def _apply_state_to_capability(executor: Callable, capability_id: str) -> Callab
 def _resolve_middleware_config(capability_id: str) -> list[dict[str, Any]]:
     # Try to use the new plugin resolver if available
     try:
-        from agent.config import get_plugin_resolver
-
         resolver = get_plugin_resolver()
         if resolver:
-            # Get the actual plugin name that provides this capability
-            plugin_name = capability_id  # Default fallback
-            try:
-                from agent.plugins.integration import get_plugin_adapter
-
-                adapter = get_plugin_adapter()
-                if adapter:
-                    capability_info = adapter.get_capability_info(capability_id)
-                    if capability_info and "plugin_name" in capability_info:
-                        plugin_name = capability_info["plugin_name"]
-                        logger.debug(f"Resolved capability '{capability_id}' to plugin '{plugin_name}'")
-            except Exception as e:
-                logger.debug(f"Could not resolve plugin name for capability '{capability_id}': {e}")
+            plugin_name = _resolve_plugin_name(capability_id)
 
             # Use the new resolver to get effective middleware
             effective_middleware = resolver.get_effective_middleware(plugin_name, capability_id)
@@ -592,21 +655,10 @@ def _resolve_middleware_config(capability_id: str) -> list[dict[str, Any]]:
 
     # Fallback to legacy configuration loading
     global_middleware_configs = _load_middleware_config()
+    if not _has_plugin_overrides(_MIDDLEWARE_OVERRIDE_KEYS):
+        return global_middleware_configs
 
-    # Get the actual plugin name that provides this capability
-    plugin_name = capability_id  # Default fallback
-    try:
-        from agent.plugins.integration import get_plugin_adapter
-
-        adapter = get_plugin_adapter()
-        if adapter:
-            capability_info = adapter.get_capability_info(capability_id)
-            if capability_info and "plugin_name" in capability_info:
-                plugin_name = capability_info["plugin_name"]
-                logger.debug(f"Resolved capability '{capability_id}' to plugin '{plugin_name}'")
-    except Exception as e:
-        logger.debug(f"Could not resolve plugin name for capability '{capability_id}': {e}")
-
+    plugin_name = _resolve_plugin_name(capability_id)
     plugin_config = _get_plugin_config(plugin_name)
 
     # Check for plugin-specific middleware override
@@ -622,13 +674,33 @@ def _resolve_middleware_config(capability_id: str) -> list[dict[str, Any]]:
     return global_middleware_configs
 
 
-def _apply_middleware_to_capability(executor: Callable, capability_id: str) -> Callable:
-    middleware_configs = _resolve_middleware_config(capability_id)
+def _get_middleware_decorator(middleware_configs: list[dict[str, Any]]) -> Callable[[Callable], Callable]:
+    global _global_middleware_decorator
+    if middleware_configs is not _load_middleware_config():
+        # Plugin-specific override
+        return with_middleware(middleware_configs)
+
+    # Global middleware is shared by every capability without an override, so compose it once
+    if _global_middleware_decorator is None:
+        _global_middleware_decorator = with_middleware(middleware_configs)
+    return _global_middleware_decorator
+
+
+def _apply_middleware_to_capability(
+    executor: Callable, capability_id: str, middleware_configs: list[dict[str, Any]] | None = None
+) -> Callable:
+    if middleware_configs is None:
+        middleware_configs = _resolve_middleware_config(capability_id)
+
+    if not middleware_configs:
+        # Nothing to wrap with; record the capability as handled and skip decoration
+        _capabilities_with_middleware.add(capability_id)
+        return executor
 
     try:
         # Mark the capability as having middleware applied in global registry
         _capabilities_with_middleware.add(capability_id)
-        wrapped_executor = with_middleware(middleware_configs)(executor)
+        wrapped_executor = _get_middleware_decorator(middleware_configs)(executor)
         logger.debug(f"Applied middleware to plugin '{capability_id}': {middleware_configs}")
         return wrapped_executor
     except Exception as e:
@@ -636,66 +708,51 @@ def _apply_middleware_to_capability(executor: Callable, capability_id: str) -> C
         return executor
 
 
-def register_capability(capability_id: str):
-    def decorator(func: Callable[[Task], str] | Callable[[Task], Callable[[], str]]):
-        features_applied = []
-
-        # Apply authentication context first
-        wrapped_func = _apply_auth_to_capability(func, capability_id)
-        features_applied.append("auth")
-
-        # Apply middleware automatically based on agent config
-        middleware_configs = _resolve_middleware_config(capability_id)
-        if middleware_configs:
-            wrapped_func = _apply_middleware_to_capability(wrapped_func, capability_id)
-            features_applied.append("middleware")
-
-        # Apply state management automatically based on agent config
-        state_config = _resolve_state_config(capability_id)
-        if state_config.get("enabled", False):
-            wrapped_func = _apply_state_to_capability(wrapped_func, capability_id)
-            features_applied.append("state")
-
-        _capabilities[capability_id] = wrapped_func
-        logger.debug(f"Registered capability '{capability_id}' with: {', '.join(features_applied)}")
-        return wrapped_func
-
-    return decorator
-
-
-def register_capability_function(
-    capability_id: str, executor: Callable[[Task], str] | Callable[[Task], Awaitable[str]]
-) -> None:
+def _build_capability_wrapper(executor: Callable, capability_id: str) -> Callable:
+    # Resolve auth, middleware and state once and only add the layers that have work to do
     features_applied = []
 
     # Apply authentication context first
     wrapped_executor = _apply_auth_to_capability(executor, capability_id)
-    features_applied.append("auth")
+    if wrapped_executor is not executor:
+        features_applied.append("auth")
 
     # Apply middleware automatically based on agent config
     middleware_configs = _resolve_middleware_config(capability_id)
     if middleware_configs:
-        wrapped_executor = _apply_middleware_to_capability(wrapped_executor, capability_id)
+        wrapped_executor = _apply_middleware_to_capability(wrapped_executor, capability_id, middleware_configs)
         features_applied.append("middleware")
 
     # Apply state management automatically based on agent config
     state_config = _resolve_state_config(capability_id)
     if state_config.get("enabled", False):
-        wrapped_executor = _apply_state_to_capability(wrapped_executor, capability_id)
+        wrapped_executor = _apply_state_to_capability(wrapped_executor, capability_id, state_config)
         features_applied.append("state")
 
-    _capabilities[capability_id] = wrapped_executor
-    logger.debug(f"Registered capability '{capability_id}' with: {', '.join(features_applied)}")
+    logger.debug(f"Registered capability '{capability_id}' with: {', '.join(features_applied) or 'no wrappers'}")
+    return wrapped_executor
+
+
+def register_capability(capability_id: str):
+    def decorator(func: Callable[[Task], str] | Callable[[Task], Callable[[], str]]):
+        wrapped_func = _build_capability_wrapper(func, capability_id)
+        _capabilities[capability_id] = wrapped_func
+        return wrapped_func
+
+    return decorator
+
+
+def register_capability_function(
+    capability_id: str, executor: Callable[[Task], str] | Callable[[Task], Awaitable[str]]
+) -> None:
+    _capabilities[capability_id] = _build_capability_wrapper(executor, capability_id)
 
 
 def get_capability_executor(capability_id: str) -> Callable[[Task], str] | Callable[[Task], Awaitable[str]] | None:
     # Check unified capabilities registry
-    logger.debug(f"Available capabilities: {list(_capabilities.keys())}")
     executor = _capabilities.get(capability_id)
     if executor is None:
         logger.warning(f"Capability '{capability_id}' not found in unified capabilities registry")
-        return None
-    logger.debug(f"Retrieved capability executor for '{capability_id}': {executor}")
     return executor
 
 
@@ -704,13 +761,16 @@ async def execute_status(task: Task) -> str:
 
 
 async def execute_capabilities(task: Task) -> str:
-    capabilities = list(_capabilities.keys())
-    lines = "\n".join(f"- {capability}" for capability in capabilities)
-    return f"{_project_name} capabilities:\n{lines}"
+    global _capabilities_listing_cache
+    if _capabilities_listing_cache is None:
+        lines = "\n".join(f"- {capability}" for capability in _get_sorted_capability_ids())
+        _capabilities_listing_cache = f"{_project_name} capabilities:\n{lines}"
+    return _capabilities_listing_cache
 
 
-def get_all_capabilities() -> dict[str, Callable[[Task], str] | Callable[[Task], Awaitable[str]]]:
-    return _capabilities.copy()
+def get_all_capabilities() -> Mapping[str, Callable[[Task], str] | Callable[[Task], Awaitable[str]]]:
+    # Read-only view; use dict(get_all_capabilities()) for a mutable snapshot
+    return _capabilities_view
 
 
 def list_capabilities() -> list[str]:
@@ -741,19 +801,10 @@ def apply_global_middleware() -> None:
 
     logger.info(f"Applying global middleware to {_project_name} capability executors: {middleware_configs}")
 
-    # Count executors that already have middleware applied using global registry
-    executors_with_middleware = []
-    executors_needing_middleware = []
-
-    for capability_id, _executor in _capabilities.items():
-        has_middleware_flag = capability_id in _capabilities_with_middleware
-        logger.debug(f"Capability executor '{capability_id}' has middleware flag: {has_middleware_flag}")
-        if has_middleware_flag:
-            executors_with_middleware.append(capability_id)
-        else:
-            executors_needing_middleware.append(capability_id)
-
-    logger.debug(f"Executors with middleware: {executors_with_middleware}")
+    # Single pass over the registry: middleware is tracked per capability id in the global registry
+    executors_needing_middleware = [
+        capability_id for capability_id in _capabilities if capability_id not in _capabilities_with_middleware
+    ]
 
     # Only apply middleware to executors that don't already have it
     for capability_id in executors_needing_middleware:
@@ -790,26 +841,22 @@ def apply_global_state_management() -> None:
         _global_state_applied = True
         return
 
-    # Re-wrap all existing capability executors with state management
+    # Re-wrap existing capability executors with state management, tracking which ones needed it
+    executors_needing_state = []
     for capability_id, executor in list(_capabilities.items()):
+        # Only apply if not already wrapped using global registry
+        if capability_id in _capabilities_with_state:
+            continue
+        executors_needing_state.append(capability_id)
         try:
-            # Only apply if not already wrapped using global registry
-            if capability_id not in _capabilities_with_state:
-                wrapped_executor = _apply_state_to_capability(executor, capability_id)
-                _capabilities[capability_id] = wrapped_executor
-                logger.debug(f"Applied global state management to existing capability executor: {capability_id}")
-            else:
-                logger.debug(f"Capability executor '{capability_id}' already has state management applied, skipping")
+            wrapped_executor = _apply_state_to_capability(executor, capability_id)
+            _capabilities[capability_id] = wrapped_executor
+            logger.debug(f"Applied global state management to existing capability executor: {capability_id}")
         except Exception as e:
             logger.error(f"Failed to apply global state management to {capability_id}: {e}")
 
     _global_state_applied = True
 
-    # Count executors that actually needed global state management using global registry
-    executors_needing_state = [
-        capability_id for capability_id in _capabilities.keys() if capability_id not in _capabilities_with_state
-    ]
-
     if executors_needing_state:
         logger.info(
             f"Applied global state management to {len(executors_needing_state)} capability executors: {executors_needing_state}"
@@ -818,10 +865,19 @@ def apply_global_state_management() -> None:
         logger.debug("All capability executors already have state management applied during registration")
 
 
+def reset_plugin_config_cache() -> None:
+    global _plugin_config_index, _plugin_override_keys
+    _plugin_config_index = None
+    _plugin_override_keys = frozenset()
+    _plugin_name_cache.clear()
+
+
 def reset_middleware_cache() -> None:
-    global _middleware_config, _global_middleware_applied
+    global _middleware_config, _global_middleware_decorator, _global_middleware_applied
     _middleware_config = None
+    _global_middleware_decorator = None
     _global_middleware_applied = False
+    reset_plugin_config_cache()
     logger.debug("Reset middleware configuration cache")
 
 
@@ -829,6 +885,7 @@ def reset_state_cache() -> None:
     global _state_config, _global_state_applied
     _state_config = None
     _global_state_applied = False
+    reset_plugin_config_cache()
     logger.debug("Reset state configuration cache")
 
 
@@ -1,9 +1,49 @@
+import asyncio
+import importlib
 import os
 import tarfile
 from collections import OrderedDict
+from collections.abc import Coroutine
+from functools import cache
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import click
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Shared option types, built once and reused by every command that needs them
+ANY_PATH = click.Path()
+EXISTING_PATH = click.Path(exists=True)
+
+T = TypeVar("T")
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a command's coroutine to completion, on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+
+@cache
+def get_console() -> "Console":
+    """Shared Rich console for tables and panels, created on first use.
+
+    Output is already styled explicitly, so Rich's repr highlighter is turned off
+    rather than run over every printed string.
+    """
+    from rich.console import Console
+
+    return Console(highlight=False)
+
+
+def truncate(text: str, limit: int) -> str:
+    """Shorten text for a table cell, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
 
 def _is_within_directory(base_dir: str, target_path: str) -> bool:
     """
@@ -31,10 +71,26 @@ class OrderedGroup(click.Group):
     def __init__(self, name=None, commands=None, **attrs):
         super().__init__(name=name, commands=commands, **attrs)
         self.commands = OrderedDict()
+        self.lazy_commands: dict[str, str] = {}
+        self._command_order: list[str] = []
 
     def add_command(self, cmd, name=None):
         name = name or cmd.name
         self.commands[name] = cmd
+        if name not in self._command_order:
+            self._command_order.append(name)
+
+    def add_lazy_command(self, import_path: str, name: str) -> None:
+        """Register a command by its "module.attribute" path; it is imported the first time it is needed."""
+        self.lazy_commands[name] = import_path
+        if name not in self._command_order:
+            self._command_order.append(name)
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module_name, attr = self.lazy_commands[cmd_name].rsplit(".", 1)
+            self.commands[cmd_name] = getattr(importlib.import_module(module_name), attr)
+        return self.commands.get(cmd_name)
 
     def list_commands(self, ctx):
-        return self.commands.keys()
+        return self._command_order
@@ -1,4 +1,5 @@
-import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Any
 
@@ -6,18 +7,45 @@ import click
 import httpx
 import questionary
 
+from agent.cli.cli_utils import ANY_PATH, EXISTING_PATH, run_async
 from agent.cli.style import custom_style, print_error, print_header, print_success_footer
 from agent.generator import ProjectGenerator
-from agent.templates import get_feature_choices
+from agent.templates import get_default_features, get_feature_choices
 from agent.utils.git_utils import get_git_author_info, initialize_git_repo
 
+_CREATING_PROJECT = click.style("Creating project...", fg="yellow")
+_INITIALIZING_GIT = click.style("Initializing git repository...", fg="yellow")
+_GIT_INITIALIZED = click.style("Git repository initialized", fg="green")
+
+
+@dataclass(slots=True)
+class ProjectConfig:
+    """Answers collected by init, handed to ProjectGenerator as a dict."""
+
+    name: str | None = None
+    description: str | None = None
+    version: str | None = None
+    author_info: dict[str, str | None] | None = None
+    agent_type: str | None = None
+    max_iterations: int | None = None
+    memory_enabled: bool | None = None
+    features: list[str] | None = None
+    feature_config: dict[str, Any] | None = None
+    ai_provider_config: dict[str, Any] | None = None
+    services: list[str] | None = None
+    base_config: Path | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        # Unanswered fields are left out so the generator falls back to its own defaults
+        return {f.name: value for f in fields(self) if (value := getattr(self, f.name)) is not None}
+
 
 @click.command()
 @click.argument("name", required=False)
 @click.argument("version", required=False)
 @click.option("--quick", "-q", is_flag=True, help="Quick setup with minimal features (basic handlers only)")
-@click.option("--output-dir", "-o", type=click.Path(), help="Output directory")
-@click.option("--config", "-c", type=click.Path(exists=True), help="Use existing agentup.yml as template")
+@click.option("--output-dir", "-o", type=ANY_PATH, help="Output directory")
+@click.option("--config", "-c", type=EXISTING_PATH, help="Use existing agentup.yml as template")
 @click.option("--no-git", is_flag=True, help="Skip git repository initialization")
 def init_agent(
     name: str | None,
@@ -37,7 +65,7 @@ def init_agent(
     # Initial setup
     output_path: Path | None
     if config:
-        project_config = {"base_config": Path(config)}
+        project_config = ProjectConfig(base_config=Path(config))
         output_path = Path(output_dir) if output_dir else Path.cwd() / "new_agent"
         if not name:
             click.echo("Warning: Agent name will be read from config file.", err=True)
@@ -51,9 +79,9 @@ def init_agent(
         _prompt_for_features(project_config, quick, no_git)
 
     # Generate the project
-    click.echo(f"\n{click.style('Creating project...', fg='yellow')}")
+    click.echo(f"\n{_CREATING_PROJECT}")
     try:
-        generator = ProjectGenerator(output_path, project_config)
+        generator = ProjectGenerator(output_path, project_config.to_dict())
         generator.generate()
 
         _handle_git_initialization(output_path, no_git)
@@ -78,16 +106,15 @@ def init_agent(
 # Helper functions
 def _prompt_for_basic_config(
     name: str | None, version: str | None, quick: bool, output_dir: str | None
-) -> tuple[dict[str, Any], Path | None]:
+) -> tuple[ProjectConfig, Path | None]:
     """Prompts for basic project configuration and returns the config and output path."""
-    project_config: dict[str, Any] = {}
 
     if not name:
         name = questionary.text("Agent name:", style=custom_style, validate=lambda x: len(x.strip()) > 0).ask()
         if not name:
             click.echo("Cancelled.")
-            return {}, None
-    project_config["name"] = name
+            return ProjectConfig(), None
+    project_config = ProjectConfig(name=name)
 
     output_path: Path
     if not output_dir:
@@ -105,25 +132,25 @@ def _prompt_for_basic_config(
             f"Directory {output_path} already exists. Continue?", default=False, style=custom_style
         ).ask():
             click.echo("Cancelled.")
-            return {}, None
+            return ProjectConfig(), None
 
     if quick:
-        project_config["description"] = f"AI Agent {name} Project."
-        project_config["version"] = version or "0.0.1"
+        project_config.description = f"AI Agent {name} Project."
+        project_config.version = version or "0.0.1"
     else:
         description = questionary.text("Description:", default=f"AI Agent {name} Project.", style=custom_style).ask()
-        project_config["description"] = description
+        project_config.description = description
         if not version:
             version = questionary.text("Version:", default="0.0.1", style=custom_style).ask()
-        project_config["version"] = version
+        project_config.version = version
 
     return project_config, output_path
 
 
-def _prompt_for_features(project_config: dict[str, Any], quick: bool, no_git: bool):
+def _prompt_for_features(project_config: ProjectConfig, quick: bool, no_git: bool):
     """Prompts for and configures advanced features."""
     if not no_git:
-        project_config["author_info"] = get_git_author_info()
+        project_config.author_info = get_git_author_info()
 
     # Agent type selection (always prompt, even in quick mode)
     agent_type_choices = [
@@ -138,7 +165,7 @@ def _prompt_for_features(project_config: dict[str, Any], quick: bool, no_git: bo
         style=custom_style,
     ).ask()
 
-    project_config["agent_type"] = selected_agent_type
+    project_config.agent_type = selected_agent_type
 
     # Configure iterative-specific settings if selected
     if selected_agent_type == "iterative":
@@ -153,50 +180,46 @@ def _prompt_for_features(project_config: dict[str, Any], quick: bool, no_git: bo
         except ValueError:
             max_iterations = 10
 
-        project_config["max_iterations"] = max_iterations
+        project_config.max_iterations = max_iterations
 
         memory_enabled = questionary.confirm(
             "Enable memory for learning and context preservation?", default=True, style=custom_style
         ).ask()
 
-        project_config["memory_enabled"] = memory_enabled
+        project_config.memory_enabled = memory_enabled
 
     if quick:
-        default_features = [choice.value for choice in get_feature_choices() if choice.checked]
-        project_config["features"] = default_features
-        project_config["feature_config"] = {}
-        project_config["ai_provider_config"] = {"provider": "openai"}
-        project_config["services"] = []
+        project_config.features = list(get_default_features())
+        project_config.feature_config = {}
+        project_config.ai_provider_config = {"provider": "openai"}
+        project_config.services = []
         return
 
     # Standard mode
     if questionary.confirm("Customize Agent (services, security, middleware)?", default=True, style=custom_style).ask():
-        feature_choices = get_feature_choices()
-        for choice in feature_choices:
-            choice.checked = False
-
+        feature_choices = get_feature_choices(selected=())
         selected_features = questionary.checkbox(
             "Select features to include:", choices=feature_choices, style=custom_style
         ).ask()
         if selected_features is not None:
             feature_config = configure_features(selected_features)
-            project_config["features"] = selected_features
-            project_config["feature_config"] = feature_config
+            project_config.features = selected_features
+            project_config.feature_config = feature_config
 
     # Configure AI provider
     ai_config = get_ai_provider_config(custom_style)
     if ai_config:
-        project_config["ai_provider_config"] = ai_config
+        project_config.ai_provider_config = ai_config
 
     # Configure external services
-    if "services" in project_config.get("features", []):
+    if "services" in (project_config.features or []):
         print_header("External Services Configuration")
         service_choices = [
             questionary.Choice("Valkey", value="valkey"),
             questionary.Choice("Custom API", value="custom"),
         ]
         selected = questionary.checkbox("Select external services:", choices=service_choices, style=custom_style).ask()
-        project_config["services"] = selected if selected else []
+        project_config.services = selected if selected else []
 
 
 def get_ai_provider_config(custom_style) -> dict[str, Any] | None:
@@ -234,7 +257,7 @@ def get_ai_provider_config(custom_style) -> dict[str, Any] | None:
 
 def _select_ollama_model(custom_style) -> str | None:
     """Get Ollama model selection from user."""
-    models = asyncio.run(get_ollama_models())
+    models = run_async(get_ollama_models())
 
     if not models:
         click.echo("No models found locally. Defaulting to 'llama3:latest'.", err=True)
@@ -253,10 +276,10 @@ def _select_ollama_model(custom_style) -> str | None:
 def _handle_git_initialization(output_dir: Path, no_git: bool):
     """Initializes a Git repository in the output directory."""
     if not no_git:
-        click.echo(f"{click.style('Initializing git repository...', fg='yellow')}")
+        click.echo(_INITIALIZING_GIT)
         success, error = initialize_git_repo(output_dir)
         if success:
-            click.echo(f"{click.style('Git repository initialized', fg='green')}")
+            click.echo(_GIT_INITIALIZED)
         else:
             click.echo(f"{click.style(f'Warning: Could not initialize git repository: {error}', fg='yellow')}")
 
@@ -286,129 +309,153 @@ async def get_ollama_models() -> list[str]:
         return []
 
 
-def configure_features(features: list) -> dict[str, Any]:
-    config = {}
-
-    if "middleware" in features:
-        print_header("Middleware Configuration")
-        middleware_choices = [
-            questionary.Choice("Rate Limiting", value="rate_limit", checked=True),
-            questionary.Choice("Caching", value="cache", checked=True),
-            questionary.Choice("Retry Logic", value="retry"),
-        ]
-        selected = questionary.checkbox(
-            "Select middleware to include:", choices=middleware_choices, style=custom_style
-        ).ask()
-        config["middleware"] = selected if selected else []
-        if "cache" in (selected or []):
-            cache_backend_choice = questionary.select(
-                "Select cache backend:",
-                choices=[
-                    questionary.Choice("Memory (development, fast)", value="memory"),
-                    questionary.Choice("Valkey/Redis (production, persistent)", value="valkey"),
-                ],
-                style=custom_style,
-            ).ask()
-            config["cache_backend"] = cache_backend_choice
-
-    if "state_management" in features:
-        print_header("State Management Configuration")
-        state_backend_choice = questionary.select(
-            "Select state management backend:",
-            choices=[
-                questionary.Choice("Valkey/Redis (production, distributed)", value="valkey"),
-                questionary.Choice("Memory (development, non-persistent)", value="memory"),
-                questionary.Choice("File (local development, persistent)", value="file"),
-            ],
-            style=custom_style,
-        ).ask()
-        config["state_backend"] = state_backend_choice
-
-    if "auth" in features:
-        print_header("Authentication Configuration")
-        auth_choice = questionary.select(
-            "Select authentication method:",
-            choices=[
-                questionary.Choice("API Key (simple, but less secure)", value="api_key"),
-                questionary.Choice("JWT Bearer", value="jwt"),
-                questionary.Choice("OAuth2 (with provider integration)", value="oauth2"),
-            ],
-            style=custom_style,
-        ).ask()
-        config["auth"] = auth_choice
-        if auth_choice == "oauth2":
-            oauth2_provider = questionary.select(
-                "Select OAuth2 provider:",
-                choices=[
-                    questionary.Choice("GitHub (introspection-based)", value="github"),
-                    questionary.Choice("Google (JWT-based)", value="google"),
-                    questionary.Choice("Keycloak (JWT-based)", value="keycloak"),
-                    questionary.Choice("Generic (configurable)", value="generic"),
-                ],
-                style=custom_style,
-            ).ask()
-            config["oauth2_provider"] = oauth2_provider
-
-    if "push_notifications" in features:
-        print_header("Push Notifications Configuration")
-        push_backend_choice = questionary.select(
-            "Select push notifications backend:",
-            choices=[
-                questionary.Choice("Memory (development, non-persistent)", value="memory"),
-                questionary.Choice("Valkey/Redis (production, persistent)", value="valkey"),
-            ],
-            style=custom_style,
+# Prompt options as (title, value, checked by default); see _choices
+_MIDDLEWARE_CHOICES: tuple[tuple[str, str, bool], ...] = (
+    ("Rate Limiting", "rate_limit", True),
+    ("Caching", "cache", True),
+    ("Retry Logic", "retry", False),
+)
+
+_CACHE_BACKEND_CHOICES: tuple[tuple[str, str, bool], ...] = (
+    ("Memory (development, fast)", "memory", False),
+    ("Valkey/Redis (production, persistent)", "valkey", False),
+)
+
+_STATE_BACKEND_CHOICES: tuple[tuple[str, str, bool], ...] = (
+    ("Valkey/Redis (production, distributed)", "valkey", False),
+    ("Memory (development, non-persistent)", "memory", False),
+    ("File (local development, persistent)", "file", False),
+)
+
+_AUTH_CHOICES: tuple[tuple[str, str, bool], ...] = (
+    ("API Key (simple, but less secure)", "api_key", False),
+    ("JWT Bearer", "jwt", False),
+    ("OAuth2 (with provider integration)", "oauth2", False),
+)
+
+_OAUTH2_PROVIDER_CHOICES: tuple[tuple[str, str, bool], ...] = (
+    ("GitHub (introspection-based)", "github", False),
+    ("Google (JWT-based)", "google", False),
+    ("Keycloak (JWT-based)", "keycloak", False),
+    ("Generic (configurable)", "generic", False),
+)
+
+_PUSH_BACKEND_CHOICES: tuple[tuple[str, str, bool], ...] = (
+    ("Memory (development, non-persistent)", "memory", False),
+    ("Valkey/Redis (production, persistent)", "valkey", False),
+)
+
+
+def _choices(options: tuple[tuple[str, str, bool], ...]) -> list[questionary.Choice]:
+    # questionary mutates Choice objects while prompting, so build fresh ones per prompt
+    return [questionary.Choice(title, value=value, checked=checked) for title, value, checked in options]
+
+
+def _prompt_middleware(config: dict[str, Any]) -> None:
+    print_header("Middleware Configuration")
+    selected = questionary.checkbox(
+        "Select middleware to include:", choices=_choices(_MIDDLEWARE_CHOICES), style=custom_style
+    ).ask()
+    config["middleware"] = selected if selected else []
+    if "cache" in (selected or []):
+        config["cache_backend"] = questionary.select(
+            "Select cache backend:", choices=_choices(_CACHE_BACKEND_CHOICES), style=custom_style
         ).ask()
-        config["push_backend"] = push_backend_choice
-        validate_urls = questionary.confirm(
-            "Enable webhook URL validation?",
-            default=push_backend_choice == "valkey",
-            style=custom_style,
+
+
+def _prompt_state_management(config: dict[str, Any]) -> None:
+    print_header("State Management Configuration")
+    config["state_backend"] = questionary.select(
+        "Select state management backend:", choices=_choices(_STATE_BACKEND_CHOICES), style=custom_style
+    ).ask()
+
+
+def _prompt_auth(config: dict[str, Any]) -> None:
+    print_header("Authentication Configuration")
+    auth_choice = questionary.select(
+        "Select authentication method:", choices=_choices(_AUTH_CHOICES), style=custom_style
+    ).ask()
+    config["auth"] = auth_choice
+    if auth_choice == "oauth2":
+        config["oauth2_provider"] = questionary.select(
+            "Select OAuth2 provider:", choices=_choices(_OAUTH2_PROVIDER_CHOICES), style=custom_style
         ).ask()
-        config["push_validate_urls"] = validate_urls
 
-    if "development" in features:
-        print_header("Development Features Configuration")
-        dev_enabled = questionary.confirm(
-            "Enable development features? (filesystem plugins, debug mode)",
-            default=False,
+
+def _prompt_push_notifications(config: dict[str, Any]) -> None:
+    print_header("Push Notifications Configuration")
+    push_backend_choice = questionary.select(
+        "Select push notifications backend:", choices=_choices(_PUSH_BACKEND_CHOICES), style=custom_style
+    ).ask()
+    config["push_backend"] = push_backend_choice
+    config["push_validate_urls"] = questionary.confirm(
+        "Enable webhook URL validation?",
+        default=push_backend_choice == "valkey",
+        style=custom_style,
+    ).ask()
+
+
+def _prompt_development(config: dict[str, Any]) -> None:
+    print_header("Development Features Configuration")
+    dev_enabled = questionary.confirm(
+        "Enable development features? (filesystem plugins, debug mode)",
+        default=False,
+        style=custom_style,
+    ).ask()
+    config["development_enabled"] = dev_enabled
+    if dev_enabled:
+        filesystem_plugins = questionary.confirm(
+            "Enable filesystem plugin loading? (allows loading plugins from directories)",
+            default=True,
             style=custom_style,
         ).ask()
-        config["development_enabled"] = dev_enabled
-        if dev_enabled:
-            filesystem_plugins = questionary.confirm(
-                "Enable filesystem plugin loading? (allows loading plugins from directories)",
-                default=True,
-                style=custom_style,
+        config["filesystem_plugins_enabled"] = filesystem_plugins
+        if filesystem_plugins:
+            config["plugin_directory"] = questionary.text(
+                "Plugin directory path:", default="~/.agentup/plugins", style=custom_style
             ).ask()
-            config["filesystem_plugins_enabled"] = filesystem_plugins
-            if filesystem_plugins:
-                plugin_dir = questionary.text(
-                    "Plugin directory path:", default="~/.agentup/plugins", style=custom_style
-                ).ask()
-                config["plugin_directory"] = plugin_dir
-
-    if "mcp" in features:
-        # MCP (Model Context Protocol) configuration
-        # Configure filesystem server path
-        # Bandit, marking as nosec, because there is unlikely to be a safer default path for a user to select
-        fs_path = "/tmp"  # nosec
-        config["mcp_filesystem_path"] = fs_path
-
-    if "deployment" in features:
-        print_header("Deployment Configuration", "Configure deployment options for your agent")
-        # Docker configuration - always enabled
-        config["docker_enabled"] = True
-        docker_registry = questionary.text("Docker registry (optional):", default="", style=custom_style).ask()
-        config["docker_registry"] = docker_registry if docker_registry else None
-        helm_enabled = questionary.confirm(
-            "Generate Helm charts for Kubernetes deployment?", default=True, style=custom_style
+
+
+def _prompt_mcp(config: dict[str, Any]) -> None:
+    # MCP (Model Context Protocol) configuration
+    # Configure filesystem server path
+    # Bandit, marking as nosec, because there is unlikely to be a safer default path for a user to select
+    config["mcp_filesystem_path"] = "/tmp"  # nosec
+
+
+def _prompt_deployment(config: dict[str, Any]) -> None:
+    print_header("Deployment Configuration", "Configure deployment options for your agent")
+    # Docker configuration - always enabled
+    config["docker_enabled"] = True
+    docker_registry = questionary.text("Docker registry (optional):", default="", style=custom_style).ask()
+    config["docker_registry"] = docker_registry if docker_registry else None
+    helm_enabled = questionary.confirm(
+        "Generate Helm charts for Kubernetes deployment?", default=True, style=custom_style
+    ).ask()
+    config["helm_enabled"] = helm_enabled
+    if helm_enabled:
+        # Helm configuration
+        config["helm_namespace"] = questionary.text(
+            "Default Kubernetes namespace:", default="default", style=custom_style
         ).ask()
-        config["helm_enabled"] = helm_enabled
-        if helm_enabled:
-            # Helm configuration
-            helm_namespace = questionary.text(
-                "Default Kubernetes namespace:", default="default", style=custom_style
-            ).ask()
-            config["helm_namespace"] = helm_namespace
+
+
+# Prompt handlers in the order they are asked, regardless of the order features were selected in
+_FEATURE_PROMPTS: dict[str, Callable[[dict[str, Any]], None]] = {
+    "middleware": _prompt_middleware,
+    "state_management": _prompt_state_management,
+    "auth": _prompt_auth,
+    "push_notifications": _prompt_push_notifications,
+    "development": _prompt_development,
+    "mcp": _prompt_mcp,
+    "deployment": _prompt_deployment,
+}
+
+
+def configure_features(features: list) -> dict[str, Any]:
+    config: dict[str, Any] = {}
+    selected = set(features)
+    for feature, prompt in _FEATURE_PROMPTS.items():
+        if feature in selected:
+            prompt(config)
     return config
@@ -8,22 +8,70 @@ MCP servers from the official registry.
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import re
 import sys
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any
 
 import click
 import yaml
-from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.table import Table
 
 from ...config.intent import load_intent_config, save_intent_config
 from ...config.model import MCPServerConfig
 from ...services.mcp_config_mapper import MCPConfigError, MCPConfigMapper
 from ...services.mcp_package_installer import MCPPackageError, MCPPackageInstaller
 from ...services.mcp_registry import MCPRegistryClient, MCPRegistryError, RegistryServer
+from ..cli_utils import get_console, run_async, truncate
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.table import Table
+
+    from ...config.intent import IntentConfig
+
+
+# Column header -> Rich column options, per table
+_REGISTRY_SERVER_COLUMNS: tuple[tuple[str, dict[str, Any]], ...] = (
+    ("ID", {"style": "cyan", "no_wrap": True}),
+    ("Description", {"style": "white"}),
+    ("Version", {"style": "green"}),
+    ("Status", {"style": "yellow"}),
+    ("Packages", {"style": "blue"}),
+)
+_PACKAGE_COLUMNS: tuple[tuple[str, dict[str, Any]], ...] = (
+    ("Index", {"style": "cyan", "width": 6}),
+    ("Type", {"style": "yellow", "width": 8}),
+    ("Identifier", {"style": "green"}),
+    ("Version", {"style": "blue", "width": 10}),
+    ("Transport", {"style": "magenta", "width": 12}),
+)
+_VALIDATION_COLUMNS: tuple[tuple[str, dict[str, Any]], ...] = (
+    ("Name", {"style": "cyan"}),
+    ("Transport", {"style": "yellow"}),
+    ("Status", {"style": "green"}),
+    ("Scopes", {"style": "blue"}),
+)
+_DISCOVERED_TOOL_COLUMNS: tuple[tuple[str, dict[str, Any]], ...] = (
+    ("Tool Name", {"style": "cyan"}),
+    ("Suggested Scopes", {"style": "green"}),
+    ("Reasoning", {"style": "yellow"}),
+)
+
+
+def _make_table(title: str, columns: tuple[tuple[str, dict[str, Any]], ...]) -> Table:
+    from rich.table import Table
+
+    table = Table(title=title)
+    for header, options in columns:
+        table.add_column(header, **options)
+    return table
+
+
+# Tool names that suggest code execution when explaining discovered scopes
+_CODE_EXECUTION_PATTERN = re.compile(r"run|execute")
+
+# libyaml's C emitter when PyYAML was built with it
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
 
 # Styling functions
@@ -65,6 +113,7 @@ def mcp():
 )
 @click.option("--dry-run", is_flag=True, help="Preview configuration without installing")
 @click.option("--config", "config_file", default="agentup.yml", help="Configuration file path")
+@click.option("--no-cache", is_flag=True, help="Fetch fresh server details instead of using the local cache")
 def add(
     server_id: str,
     name: str | None,
@@ -73,24 +122,27 @@ def add(
     discover_scopes: bool,
     dry_run: bool,
     config_file: str,
+    no_cache: bool,
 ):
     """Add MCP server from registry."""
-    asyncio.run(_add_server(server_id, name, package_index, scopes, discover_scopes, dry_run, config_file))
+    run_async(_add_server(server_id, name, package_index, scopes, discover_scopes, dry_run, config_file, not no_cache))
 
 
 @mcp.command()
 @click.option("--search", help="Search keyword")
 @click.option("--status", default="active", help="Filter by status")
-def list(search: str | None, status: str):
+@click.option("--no-cache", is_flag=True, help="Fetch a fresh server listing instead of using the local cache")
+def list(search: str | None, status: str, no_cache: bool):
     """List available servers in registry."""
-    asyncio.run(_list_servers(search, status))
+    run_async(_list_servers(search, status, not no_cache))
 
 
 @mcp.command()
 @click.argument("server_id", required=True)
-def info(server_id: str):
+@click.option("--no-cache", is_flag=True, help="Fetch fresh server details instead of using the local cache")
+def info(server_id: str, no_cache: bool):
     """Show server details from registry."""
-    asyncio.run(_show_server_info(server_id))
+    run_async(_show_server_info(server_id, not no_cache))
 
 
 @mcp.command()
@@ -114,7 +166,24 @@ def validate(config_file: str):
 @click.option("--apply", is_flag=True, help="Apply the suggested scopes to configuration")
 def discover_tools(server_name: str, config_file: str, apply: bool):
     """Discover tools from an MCP server and suggest scopes."""
-    asyncio.run(_discover_tools(server_name, config_file, apply))
+    run_async(_discover_tools(server_name, config_file, apply))
+
+
+@contextlib.asynccontextmanager
+async def _background_config_load(config_file: str, enabled: bool) -> AsyncIterator[asyncio.Task[IntentConfig] | None]:
+    """Load the intent config in a worker thread while the body runs.
+
+    On exit the task is cancelled if still pending and its outcome retrieved, so
+    an early return or exit never leaves a load error unobserved.
+    """
+    task = asyncio.create_task(asyncio.to_thread(load_intent_config, config_file)) if enabled else None
+    try:
+        yield task
+    finally:
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
 
 
 async def _add_server(
@@ -125,11 +194,15 @@ async def _add_server(
     discover_scopes: bool,
     dry_run: bool,
     config_file: str,
+    use_cache: bool = True,
 ):
     """Add MCP server implementation."""
     try:
-        # Initialize services
-        async with MCPRegistryClient() as registry_client:
+        # Initialize services, reading the current configuration in the background while the registry is queried
+        async with (
+            MCPRegistryClient(use_cache=use_cache) as registry_client,
+            _background_config_load(config_file, enabled=not dry_run) as config_task,
+        ):
             mapper = MCPConfigMapper()
             installer = MCPPackageInstaller()
 
@@ -174,9 +247,10 @@ async def _add_server(
             server_config.command = command
             server_config.args = args
 
-            # Load current configuration
+            # Load current configuration, started in the background unless this is a dry run
+            assert config_task is not None  # nosec
             try:
-                config = load_intent_config(config_file)
+                config = await config_task
             except Exception as e:
                 error(f"Failed to load configuration: {e}")
                 sys.exit(1)
@@ -189,13 +263,15 @@ async def _add_server(
             if "servers" not in config.mcp:
                 config.mcp["servers"] = []
 
+            # Convert server_config to dict for storage in IntentConfig
+            server_dict = server_config.model_dump(exclude_defaults=True, exclude_none=True)
+
             # If discover-scopes flag is set, connect to server and get real tool scopes
             if discover_scopes and not dry_run:
                 show_info("Discovering tools from server for accurate scopes...")
                 try:
-                    # Create temporary server dict to test connection
-                    temp_server_dict = server_config.model_dump(exclude_defaults=True, exclude_none=True)
-                    discovered_tools = await _discover_real_tools(temp_server_dict)
+                    # Test the connection with a copy so discovery can't alter the stored entry
+                    discovered_tools = await _discover_real_tools(dict(server_dict))
 
                     if discovered_tools:
                         # Generate scopes from discovered tools
@@ -203,34 +279,30 @@ async def _add_server(
                             discovered_tools, server_config.name
                         )
                         server_config.tool_scopes = discovered_scopes
+                        server_dict["tool_scopes"] = discovered_scopes
                         success(f"Discovered {len(discovered_tools)} tools and generated accurate scopes")
                     else:
                         warning("No tools discovered, using default scopes")
                 except Exception as e:
                     warning(f"Could not discover tools: {e}. Using default scopes.")
 
-            # Convert server_config to dict for storage in IntentConfig
-            server_dict = server_config.model_dump(exclude_defaults=True, exclude_none=True)
-
             # Check for existing server with same name
-            existing_servers = config.mcp["servers"]
-            existing_names = [s.get("name") for s in existing_servers if isinstance(s, dict)]
-            if server_config.name in existing_names:
+            if config.find_mcp_server(server_config.name) is not None:
                 if not click.confirm(f"Server '{server_config.name}' already exists. Replace it?"):
                     show_info("Installation cancelled.")
                     return
                 # Remove existing server
-                config.mcp["servers"] = [s for s in existing_servers if s.get("name") != server_config.name]
+                config.remove_mcp_server(server_config.name)
 
             # Add new server
             config.mcp["servers"].append(server_dict)
             config.mcp["enabled"] = True
 
             # Save configuration
-            save_intent_config(config, config_file)
+            await asyncio.to_thread(save_intent_config, config, config_file)
 
             success(f"Successfully added MCP server '{server_config.name}' from registry")
-            _show_server_summary(server, server_config)
+            _show_server_summary(server, server_dict)
 
     except MCPRegistryError as e:
         error(f"Registry error: {e}")
@@ -246,10 +318,10 @@ async def _add_server(
         sys.exit(1)
 
 
-async def _list_servers(search: str | None, status: str):
+async def _list_servers(search: str | None, status: str, use_cache: bool = True):
     """List servers implementation."""
     try:
-        async with MCPRegistryClient() as client:
+        async with MCPRegistryClient(use_cache=use_cache) as client:
             show_info("Fetching servers from registry...")
             servers = await client.list_servers(search, status)
 
@@ -257,34 +329,31 @@ async def _list_servers(search: str | None, status: str):
                 warning("No servers found matching your criteria.")
                 return
 
-            table = Table(title=f"MCP Registry Servers ({len(servers)} found)")
-            table.add_column("ID", style="cyan", no_wrap=True)
-            table.add_column("Description", style="white")
-            table.add_column("Version", style="green")
-            table.add_column("Status", style="yellow")
-            table.add_column("Packages", style="blue")
+            table = _make_table(f"MCP Registry Servers ({len(servers)} found)", _REGISTRY_SERVER_COLUMNS)
 
             for server in servers:
                 package_count = len(server.packages)
                 table.add_row(
                     server.name,
-                    server.description[:60] + "..." if len(server.description) > 60 else server.description,
+                    truncate(server.description, 60),
                     server.version,
                     server.status,
                     str(package_count),
                 )
 
-            console.print(table)
+            get_console().print(table)
 
     except MCPRegistryError as e:
         error(f"Registry error: {e}")
         sys.exit(1)
 
 
-async def _show_server_info(server_id: str):
+async def _show_server_info(server_id: str, use_cache: bool = True):
     """Show server info implementation."""
+    from rich.panel import Panel
+
     try:
-        async with MCPRegistryClient() as client:
+        async with MCPRegistryClient(use_cache=use_cache) as client:
             server = await client.get_server(server_id)
 
             # Server details panel
@@ -294,23 +363,18 @@ async def _show_server_info(server_id: str):
 [bold]Status:[/bold] {server.status}
 [bold]Repository:[/bold] {server.repository.url}"""
 
-            console.print(Panel(server_info, title="Server Information", expand=False))
+            get_console().print(Panel(server_info, title="Server Information", expand=False))
 
             # Packages table
             if server.packages:
-                table = Table(title="Available Packages")
-                table.add_column("Index", style="cyan", width=6)
-                table.add_column("Type", style="yellow", width=8)
-                table.add_column("Identifier", style="green")
-                table.add_column("Version", style="blue", width=10)
-                table.add_column("Transport", style="magenta", width=12)
+                table = _make_table("Available Packages", _PACKAGE_COLUMNS)
 
                 for i, package in enumerate(server.packages):
                     table.add_row(
                         str(i), package.registry_type, package.identifier, package.version, package.transport.type
                     )
 
-                console.print(table)
+                get_console().print(table)
             else:
                 warning("No packages available for this server.")
 
@@ -324,17 +388,8 @@ def _remove_server(server_name: str, config_file: str):
     try:
         config = load_intent_config(config_file)
 
-        # Check if MCP config exists
-        if config.mcp is None or "servers" not in config.mcp:
-            error(f"Server '{server_name}' not found in configuration.")
-            sys.exit(1)
-
         # Find and remove server
-        existing_servers = config.mcp["servers"]
-        original_count = len(existing_servers)
-        config.mcp["servers"] = [s for s in existing_servers if s.get("name") != server_name]
-
-        if len(config.mcp["servers"]) == original_count:
+        if not config.remove_mcp_server(server_name):
             error(f"Server '{server_name}' not found in configuration.")
             sys.exit(1)
 
@@ -361,11 +416,7 @@ def _validate_config(config_file: str):
             warning("No MCP servers configured.")
             return
 
-        table = Table(title="MCP Server Configuration Validation")
-        table.add_column("Name", style="cyan")
-        table.add_column("Transport", style="yellow")
-        table.add_column("Status", style="green")
-        table.add_column("Scopes", style="blue")
+        table = _make_table("MCP Server Configuration Validation", _VALIDATION_COLUMNS)
 
         for server_dict in servers:
             if not isinstance(server_dict, dict):
@@ -381,7 +432,7 @@ def _validate_config(config_file: str):
 
             table.add_row(name, transport, status, f"{scope_count} tools")
 
-        console.print(table)
+        get_console().print(table)
         success("MCP configuration is valid.")
 
     except Exception as e:
@@ -415,18 +466,14 @@ async def _discover_real_tools(server_config: dict) -> list[str]:  # pyright: ig
 async def _discover_tools(server_name: str, config_file: str, apply: bool):
     """Discover tools from MCP server implementation."""
     try:
-        config = load_intent_config(config_file)
+        config = await asyncio.to_thread(load_intent_config, config_file)
 
         if config.mcp is None or not config.mcp.get("servers"):
             error("No MCP servers configured.")
             sys.exit(1)
 
         # Find the server configuration
-        server_config = None
-        for server_dict in config.mcp["servers"]:
-            if isinstance(server_dict, dict) and server_dict.get("name") == server_name:
-                server_config = server_dict
-                break
+        server_config = config.find_mcp_server(server_name)
 
         if not server_config:
             error(f"Server '{server_name}' not found in configuration.")
@@ -446,19 +493,17 @@ async def _discover_tools(server_name: str, config_file: str, apply: bool):
         suggested_scopes = mapper._generate_tool_scopes_from_runtime(discovered_tools, server_name)
 
         # Display suggestions
-        table = Table(title=f"Discovered Tools from '{server_name}'")
-        table.add_column("Tool Name", style="cyan")
-        table.add_column("Suggested Scopes", style="green")
-        table.add_column("Reasoning", style="yellow")
+        table = _make_table(f"Discovered Tools from '{server_name}'", _DISCOVERED_TOOL_COLUMNS)
 
         for tool_name, scopes in suggested_scopes.items():
-            reasoning = "Inferred from tool name patterns"
-            if "run" in tool_name or "execute" in tool_name:
+            if _CODE_EXECUTION_PATTERN.search(tool_name):
                 reasoning = "Code execution detected - requires system:write"
+            else:
+                reasoning = "Inferred from tool name patterns"
 
             table.add_row(tool_name, ", ".join(scopes), reasoning)
 
-        console.print(table)
+        get_console().print(table)
 
         if apply:
             # Apply the suggested scopes to configuration
@@ -466,7 +511,7 @@ async def _discover_tools(server_name: str, config_file: str, apply: bool):
             current_scopes.update(suggested_scopes)
             server_config["tool_scopes"] = current_scopes
 
-            save_intent_config(config, config_file)
+            await asyncio.to_thread(save_intent_config, config, config_file)
             success(f"Applied suggested scopes to '{server_name}' configuration.")
         else:
             show_info(f"Run with --apply to add these scopes to '{server_name}' configuration.")
@@ -481,23 +526,22 @@ def _parse_scopes_string(scopes_str: str) -> dict[str, list[str]]:  # pyright: i
     scopes = {}
 
     for scope_mapping in scopes_str.split(";"):
-        scope_mapping = scope_mapping.strip()
-        if not scope_mapping:
+        tool_name, separator, scope_list = scope_mapping.partition(":")
+        if not separator:
+            if scope_mapping.strip():
+                raise ValueError(f"Invalid scope format: '{scope_mapping.strip()}'. Use 'tool:scope1,scope2' format.")
             continue
-        if ":" not in scope_mapping:
-            raise ValueError(f"Invalid scope format: '{scope_mapping}'. Use 'tool:scope1,scope2' format.")
-
-        parts = scope_mapping.split(":", 1)
-        tool_name = parts[0].strip()
-        scope_list = [s.strip() for s in parts[1].strip().split(",")]
 
-        scopes[tool_name] = scope_list
+        scopes[tool_name.strip()] = [s.strip() for s in scope_list.split(",")]
 
     return scopes
 
 
 def _show_dry_run_preview(server: RegistryServer, config: MCPServerConfig):
     """Show dry run preview."""
+    from rich.panel import Panel
+    from rich.syntax import Syntax
+
     show_info("Dry run mode - showing configuration preview:")
 
     # Convert config to dict for YAML display
@@ -513,23 +557,25 @@ def _show_dry_run_preview(server: RegistryServer, config: MCPServerConfig):
         "registry_version": config.registry_version,
     }
 
-    yaml_content = yaml.dump({"mcp": {"servers": [config_dict]}}, default_flow_style=False)
+    yaml_content = yaml.dump({"mcp": {"servers": [config_dict]}}, Dumper=_YAML_DUMPER, default_flow_style=False)
     syntax = Syntax(yaml_content, "yaml", theme="monokai", line_numbers=True)
 
-    console.print(Panel(syntax, title="Configuration Preview", expand=False))
+    get_console().print(Panel(syntax, title="Configuration Preview", expand=False))
+
 
+def _show_server_summary(server: RegistryServer, server_dict: dict[str, Any]):
+    """Show server installation summary from the stored server entry."""
+    from rich.panel import Panel
 
-def _show_server_summary(server: RegistryServer, config: MCPServerConfig):
-    """Show server installation summary."""
     summary = f"""[bold green]✓ Installation Complete[/bold green]
 
-[bold]Server:[/bold] {config.name}
+[bold]Server:[/bold] {server_dict["name"]}
 [bold]Registry ID:[/bold] {server.name}
-[bold]Transport:[/bold] {config.transport}
-[bold]Command:[/bold] {config.command}
-[bold]Tool Scopes:[/bold] {len(config.tool_scopes)} configured
+[bold]Transport:[/bold] {server_dict["transport"]}
+[bold]Command:[/bold] {server_dict.get("command")}
+[bold]Tool Scopes:[/bold] {len(server_dict["tool_scopes"])} configured
 
 The server has been added to your configuration and is ready to use.
 Run [bold cyan]agentup run[/bold cyan] to start your agent with the new MCP server."""
 
-    console.print(Panel(summary, title="Installation Summary", expand=False))
+    get_console().print(Panel(summary, title="Installation Summary", expand=False))
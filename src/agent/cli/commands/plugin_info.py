@@ -1,22 +1,83 @@
 import json
-from collections import OrderedDict
+from operator import itemgetter
+from typing import Any
 
 import click
 import structlog
 import yaml
 from rich import box
-from rich.console import Console
+from rich.console import Group, RenderableType
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
+
+from ..cli_utils import get_console, truncate
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 logger = structlog.get_logger(__name__)
 
+# libyaml's C emitter when PyYAML was built with it
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Column header -> Rich column options, per table
+_PLUGIN_COLUMNS: tuple[tuple[str, dict[str, Any]], ...] = (
+    ("Plugin", {"style": "cyan"}),
+    ("Package", {"style": "white"}),
+    ("Version", {"style": "green", "justify": "center"}),
+    ("Status", {"style": "blue", "justify": "center"}),
+)
+_PLUGIN_VERBOSE_COLUMNS: tuple[tuple[str, dict[str, Any]], ...] = (
+    ("Configured", {"style": "dim", "justify": "center"}),
+    ("Module", {"style": "dim"}),
+)
+_CAPABILITY_COLUMNS: tuple[tuple[str, dict[str, Any]], ...] = (
+    ("Capability", {"style": "cyan"}),
+    ("Plugin", {"style": "dim"}),
+    ("AI Function", {"style": "green", "justify": "center"}),
+    ("Required Scopes", {"style": "yellow"}),
+)
+_CAPABILITY_VERBOSE_COLUMNS: tuple[tuple[str, dict[str, Any]], ...] = (("Description", {"style": "white"}),)
+_VALIDATION_COLUMNS: tuple[tuple[str, dict[str, Any]], ...] = (
+    ("Capability", {"style": "cyan"}),
+    ("Plugin", {"style": "dim"}),
+    ("Status", {"justify": "center"}),
+    ("Issues", {"style": "yellow"}),
+)
+
+# Plugin discovery fields shown as-is in the first list columns
+_PLUGIN_ROW_FIELDS = itemgetter("name", "package", "version")
+
+
+def _make_table(title: str, columns: tuple[tuple[str, dict[str, Any]], ...]) -> Table:
+    table = Table(title=title, box=box.ROUNDED, title_style="bold cyan")
+    for header, options in columns:
+        table.add_column(header, **options)
+    return table
+
+
+def _to_json(data: Any) -> str:
+    """Serialize command output as indented JSON, with orjson when it is installed.
+
+    orjson writes non-ASCII characters as-is, so the stdlib fallback does the same.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def _to_yaml(data: Any, **kwargs: Any) -> str:
+    return yaml.dump(data, Dumper=_YAML_DUMPER, default_flow_style=False, **kwargs)
+
 
 @click.command("list")
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed plugin information and logging")
 @click.option("--capabilities", "-c", is_flag=True, help="Show available capabilities/AI functions")
 @click.option(
-    "--format", "-f", type=click.Choice(["table", "json", "yaml", "agentup-cfg"]), default="table", help="Output format"
+    "--format", "-f", type=click.Choice(("table", "json", "yaml", "agentup-cfg")), default="table", help="Output format"
 )
 @click.option("--agentup-cfg", is_flag=True, help="Output in agentup.yml format (same as --format agentup-cfg)")
 @click.option("--debug", is_flag=True, help="Show debug logging output")
@@ -95,7 +156,7 @@ def list_plugins(verbose: bool, capabilities: bool, format: str, agentup_cfg: bo
 
                 output["capabilities"] = capabilities_for_json
 
-            click.secho(json.dumps(output, indent=2))
+            click.secho(_to_json(output))
             return
 
         if format == "yaml":
@@ -134,18 +195,10 @@ def list_plugins(verbose: bool, capabilities: bool, format: str, agentup_cfg: bo
 
                 output["capabilities"] = capabilities_for_yaml
 
-            click.secho(yaml.dump(output, default_flow_style=False))
+            click.secho(_to_yaml(output))
             return
 
         if format == "agentup-cfg":
-            console = Console()
-
-            # Custom representer to maintain field order
-            def represent_ordereddict(dumper, data):
-                return dumper.represent_dict(data.items())
-
-            yaml.add_representer(OrderedDict, represent_ordereddict)
-
             # For agentup-cfg format, always include capabilities (no -c flag needed)
             plugins_config = []
 
@@ -160,34 +213,27 @@ def list_plugins(verbose: bool, capabilities: bool, format: str, agentup_cfg: bo
                 else:
                     display_name = base_name + " Plugin"
 
-                # Use OrderedDict to maintain field order
-                plugin_config = OrderedDict(
-                    [
-                        ("package", package_name),
-                        ("name", display_name),
-                        (
-                            "description",
-                            f"A plugin for {plugin_name.replace('_', ' ').replace('-', ' ')} functionality",
-                        ),
-                        ("tags", [plugin_name.replace("_", "-").replace(" ", "-").lower()]),
-                        ("input_mode", "text"),
-                        ("output_mode", "text"),
-                        ("priority", 50),
-                        ("capabilities", []),
-                    ]
-                )
+                # Field order is kept by dumping with sort_keys=False
+                plugin_config = {
+                    "package": package_name,
+                    "name": display_name,
+                    "description": f"A plugin for {plugin_name.replace('_', ' ').replace('-', ' ')} functionality",
+                    "tags": [plugin_name.replace("_", "-").replace(" ", "-").lower()],
+                    "input_mode": "text",
+                    "output_mode": "text",
+                    "priority": 50,
+                    "capabilities": [],
+                }
 
                 # Load capabilities for this plugin
                 plugin_capabilities = _load_plugin_capabilities(plugin_name, verbose, debug)
 
                 for cap in plugin_capabilities:
-                    capability_config = OrderedDict(
-                        [
-                            ("capability_id", cap["id"]),
-                            ("required_scopes", cap["required_scopes"]),
-                            ("enabled", True),
-                        ]
-                    )
+                    capability_config = {
+                        "capability_id": cap["id"],
+                        "required_scopes": cap["required_scopes"],
+                        "enabled": True,
+                    }
                     plugin_config["capabilities"].append(capability_config)
 
                 # Only add plugins that have capabilities
@@ -196,13 +242,12 @@ def list_plugins(verbose: bool, capabilities: bool, format: str, agentup_cfg: bo
 
             if plugins_config:
                 output = {"plugins": plugins_config}
-                # Use sort_keys=False to preserve order, default_flow_style=False for block style
-                yaml_output = yaml.dump(
-                    output, default_flow_style=False, allow_unicode=True, sort_keys=False, width=1000, indent=2
-                )
-                console.print(yaml_output)
+                # Use sort_keys=False to preserve order
+                yaml_output = _to_yaml(output, allow_unicode=True, sort_keys=False, width=1000, indent=2)
+                # Plain echo: Rich would highlight and soft-wrap the YAML
+                click.echo(yaml_output)
             else:
-                console.print("plugins: []")
+                click.echo("plugins: []")
             return
 
         # Table format (default)
@@ -222,19 +267,12 @@ def list_plugins(verbose: bool, capabilities: bool, format: str, agentup_cfg: bo
             return
 
         # Plugins table - show all available plugins
-        plugin_table = Table(title="Available Plugins", box=box.ROUNDED, title_style="bold cyan")
-        plugin_table.add_column("Plugin", style="cyan")
-        plugin_table.add_column("Package", style="white")
-        plugin_table.add_column("Version", style="green", justify="center")
-        plugin_table.add_column("Status", style="blue", justify="center")
-
-        if verbose:
-            plugin_table.add_column("Configured", style="dim", justify="center")
-            plugin_table.add_column("Module", style="dim")
+        plugin_table = _make_table(
+            "Available Plugins", (_PLUGIN_COLUMNS + _PLUGIN_VERBOSE_COLUMNS) if verbose else _PLUGIN_COLUMNS
+        )
 
         for plugin_info in all_available_plugins:
             # Determine status display
-            status = plugin_info["status"]
             if plugin_info["loaded"]:
                 status = "loaded"
             elif plugin_info["configured"]:
@@ -242,12 +280,7 @@ def list_plugins(verbose: bool, capabilities: bool, format: str, agentup_cfg: bo
             else:
                 status = "available"
 
-            row = [
-                plugin_info["name"],
-                plugin_info["package"],
-                plugin_info["version"],
-                status,
-            ]
+            row = [*_PLUGIN_ROW_FIELDS(plugin_info), status]
 
             if verbose:
                 configured = "✓" if plugin_info["configured"] else "✗"
@@ -255,7 +288,7 @@ def list_plugins(verbose: bool, capabilities: bool, format: str, agentup_cfg: bo
 
             plugin_table.add_row(*row)
 
-        console = Console()
+        console = get_console()
         console.print(plugin_table)
 
         # Only show capabilities table if --capabilities flag is used
@@ -284,14 +317,10 @@ def list_plugins(verbose: bool, capabilities: bool, format: str, agentup_cfg: bo
                     )
 
             if all_capabilities_info:
-                capabilities_table = Table(title="Available Capabilities", box=box.ROUNDED, title_style="bold cyan")
-                capabilities_table.add_column("Capability", style="cyan")
-                capabilities_table.add_column("Plugin", style="dim")
-                capabilities_table.add_column("AI Function", style="green", justify="center")
-                capabilities_table.add_column("Required Scopes", style="yellow")
-
-                if verbose:
-                    capabilities_table.add_column("Description", style="white")
+                capabilities_table = _make_table(
+                    "Available Capabilities",
+                    (_CAPABILITY_COLUMNS + _CAPABILITY_VERBOSE_COLUMNS) if verbose else _CAPABILITY_COLUMNS,
+                )
 
                 for cap_info in all_capabilities_info:
                     ai_indicator = "✓" if cap_info["ai_function"] else "✗"
@@ -305,8 +334,7 @@ def list_plugins(verbose: bool, capabilities: bool, format: str, agentup_cfg: bo
                     ]
 
                     if verbose:
-                        description = cap_info["description"] or "No description"
-                        row.append(description[:80] + "..." if len(description) > 80 else description)
+                        row.append(truncate(cap_info["description"] or "No description", 80))
 
                     capabilities_table.add_row(*row)
 
@@ -341,8 +369,8 @@ def info(capability_id: str):
         plugin_name = manager.capability_to_plugin.get(capability_id, "unknown")
         plugin = manager.plugins.get(plugin_name)
 
-        # Build info panel
-        info_lines = [
+        # Build info panel; markup strings and pre-built Text are rendered line by line
+        info_lines: list[RenderableType] = [
             f"[bold]Capability ID:[/bold] {capability.id}",
             f"[bold]Name:[/bold] {capability.name}",
             f"[bold]Version:[/bold] {capability.version}",
@@ -372,8 +400,8 @@ def info(capability_id: str):
         # Configuration schema
         if capability.config_schema:
             info_lines.extend(["", "[bold cyan]Configuration Schema:[/bold cyan]"])
-            schema_str = json.dumps(capability.config_schema, indent=2)
-            info_lines.append(f"[dim]{schema_str}[/dim]")
+            # Shown verbatim: the JSON can be large and must not be parsed as markup
+            info_lines.append(Text(_to_json(capability.config_schema), style="dim"))
 
         # AI functions
         ai_functions = manager.get_ai_functions(capability_id)
@@ -390,18 +418,18 @@ def info(capability_id: str):
                 for key, value in health.items():
                     info_lines.append(f"  • {key}: {value}")
             except Exception:
-                click.secho("[red]Error getting health status[/red]", err=True)
+                click.secho("Error getting health status", fg="red", err=True)
                 pass
 
         # Create panel
         panel = Panel(
-            "\n".join(info_lines),
+            Group(*info_lines),
             title=f"[bold cyan]{capability.name}[/bold cyan]",
             border_style="blue",
             padding=(1, 2),
         )
 
-        console = Console()
+        console = get_console()
         console.print(panel)
 
     except ImportError:
@@ -413,14 +441,14 @@ def info(capability_id: str):
 @click.command()
 @click.argument("plugin_name")
 @click.option("--capability", "-c", help="Show configuration for specific capability")
-@click.option("--format", "-f", type=click.Choice(["table", "json", "yaml"]), default="table", help="Output format")
+@click.option("--format", "-f", type=click.Choice(("table", "json", "yaml")), default="table", help="Output format")
 def config(plugin_name: str, capability: str | None, format: str):
     """Show effective plugin configuration including overrides and middleware."""
 
     try:
         from agent.config import get_plugin_resolver
 
-        console = Console()
+        console = get_console()
 
         # Get the plugin resolver
         resolver = get_plugin_resolver()
@@ -455,7 +483,7 @@ def config(plugin_name: str, capability: str | None, format: str):
                             {"name": mw.name, "params": mw.params} for mw in cap_override.middleware
                         ],
                     }
-                    click.echo(json.dumps(output, indent=2))
+                    click.echo(_to_json(output))
 
                 elif format == "yaml":
                     output = {
@@ -469,7 +497,7 @@ def config(plugin_name: str, capability: str | None, format: str):
                             {"name": mw.name, "params": mw.params} for mw in cap_override.middleware
                         ],
                     }
-                    click.echo(yaml.dump(output, default_flow_style=False))
+                    click.echo(_to_yaml(output))
 
                 else:  # table format
                     # Capability details table
@@ -533,7 +561,7 @@ def config(plugin_name: str, capability: str | None, format: str):
                         ],
                     }
 
-                click.echo(json.dumps(output, indent=2))
+                click.echo(_to_json(output))
 
             elif format == "yaml":
                 output = {
@@ -559,7 +587,7 @@ def config(plugin_name: str, capability: str | None, format: str):
                         ],
                     }
 
-                click.echo(yaml.dump(output, default_flow_style=False))
+                click.echo(_to_yaml(output))
 
             else:  # table format
                 # Plugin details table
@@ -668,12 +696,8 @@ def validate():
                 all_valid = False
 
         # Display results
-        console = Console()
-        table = Table(title="Plugin Validation Results", box=box.ROUNDED, title_style="bold cyan")
-        table.add_column("Capability", style="cyan")
-        table.add_column("Plugin", style="dim")
-        table.add_column("Status", justify="center")
-        table.add_column("Issues", style="yellow")
+        console = get_console()
+        table = _make_table("Plugin Validation Results", _VALIDATION_COLUMNS)
 
         for result in results:
             capability_id = result["capability_id"]
@@ -700,13 +724,13 @@ def validate():
         if all_valid:
             click.secho("\n✓ All plugins validated successfully!", fg="green")
         else:
-            click.secho("\n[red]✗ Some plugins have validation errors.[/red]")
+            click.secho("\n✗ Some plugins have validation errors.", fg="red")
             click.secho("Please check your agentup.yml and fix the issues.")
 
     except ImportError:
-        click.secho("[red]Plugin system not available.[/red]")
+        click.secho("Plugin system not available.", fg="red")
     except Exception as e:
-        click.secho(f"[red]Error validating plugins: {e}[/red]")
+        click.secho(f"Error validating plugins: {e}", fg="red")
 
 
 def _load_plugin_capabilities(plugin_name: str, verbose: bool = False, debug: bool = False) -> list[dict]:
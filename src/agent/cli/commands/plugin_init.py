@@ -3,11 +3,10 @@ import subprocess  # nosec
 from pathlib import Path
 
 import click
-import questionary
 import structlog
-from jinja2 import Environment, FileSystemLoader
 
-from agent.cli.style import custom_style, print_error, print_header, print_success_footer
+from agent.cli.cli_utils import ANY_PATH
+from agent.cli.style import print_error, print_header, print_success_footer
 from agent.utils.git_utils import get_git_author_info
 from agent.utils.version import get_version
 
@@ -222,6 +221,8 @@ _RESERVED_NAMES = {
 
 
 def _render_plugin_template(template_name: str, context: dict) -> str:
+    from jinja2 import Environment, FileSystemLoader
+
     templates_dir = Path(__file__).parent.parent.parent / "templates" / "plugins"
 
     # For YAML files, disable block trimming to preserve proper formatting
@@ -296,8 +297,8 @@ def _validate_plugin_name(name: str) -> tuple[bool, str]:
 @click.command()
 @click.argument("plugin_name", required=False)
 @click.argument("version", required=False)
-@click.option("--template", "-t", type=click.Choice(["direct", "ai"]), default="ai", help="Plugin template")
-@click.option("--output-dir", "-o", type=click.Path(), help="Output directory for the plugin")
+@click.option("--template", "-t", type=click.Choice(("direct", "ai")), default="ai", help="Plugin template")
+@click.option("--output-dir", "-o", type=ANY_PATH, help="Output directory for the plugin")
 @click.option("--no-git", is_flag=True, help="Skip git initialization")
 def init(
     plugin_name: str | None,
@@ -307,6 +308,10 @@ def init(
     no_git: bool,
 ):
     """Create a new AgentUp plugin with scaffolding."""
+    import questionary
+
+    from agent.cli.style import custom_style
+
     print_header("AgentUp Plugin Creator", "Let's create a new plugin!")
 
     # Interactive prompts if not provided
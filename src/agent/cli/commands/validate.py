@@ -6,12 +6,14 @@ from typing import Any
 import click
 import yaml
 
+from ..cli_utils import EXISTING_PATH
+
 
 @click.command()
 @click.option(
     "--config",
     "-c",
-    type=click.Path(exists=True),
+    type=EXISTING_PATH,
     default="agentup.yml",
     help="Path to agent configuration file",
 )
@@ -6,9 +6,6 @@ import click
 from ..utils.version import get_version
 from .cli_utils import OrderedGroup
 from .commands.deploy import deploy
-from .commands.init import init
-from .commands.mcp import mcp
-from .commands.plugin import plugin
 from .commands.run import run
 from .commands.validate import validate
 
@@ -89,12 +86,12 @@ def cli():
 
 
 # Register command groups
-cli.add_command(init)
+cli.add_lazy_command("agent.cli.commands.init_agent.init_agent", name="init")
 cli.add_command(run)
 cli.add_command(deploy)
 cli.add_command(validate)
-cli.add_command(plugin)
-cli.add_command(mcp)
+cli.add_lazy_command("agent.cli.commands.plugin.plugin", name="plugin")
+cli.add_lazy_command("agent.cli.commands.mcp.mcp", name="mcp")
 
 
 if __name__ == "__main__":
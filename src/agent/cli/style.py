@@ -1,38 +1,59 @@
 """CLI styling and formatting utilities for AgentUp commands."""
 
+from functools import cache
+from typing import TYPE_CHECKING
+
 import click
-from questionary import Style
-
-# Questionary style for interactive prompts
-custom_style = Style(
-    [
-        ("qmark", "fg:#5f819d bold"),
-        ("question", "bold"),
-        ("answer", "fg:#85678f bold"),
-        ("pointer", "fg:#5f819d bold"),
-        ("highlighted", "fg:#5f819d bold"),
-        ("selected", "fg:#85678f"),
-        ("separator", "fg:#cc6666"),
-        ("instruction", "fg:#969896"),
-        ("text", ""),
-    ]
-)
+
+if TYPE_CHECKING:
+    from questionary import Style
+
+
+@cache
+def _get_style() -> "Style":
+    """Build the questionary style for interactive prompts on first use."""
+    from questionary import Style
+
+    return Style(
+        [
+            ("qmark", "fg:#5f819d bold"),
+            ("question", "bold"),
+            ("answer", "fg:#85678f bold"),
+            ("pointer", "fg:#5f819d bold"),
+            ("highlighted", "fg:#5f819d bold"),
+            ("selected", "fg:#85678f"),
+            ("separator", "fg:#cc6666"),
+            ("instruction", "fg:#969896"),
+            ("text", ""),
+        ]
+    )
+
+
+def __getattr__(name: str):
+    # Resolve custom_style lazily so importing the CLI does not pull in questionary/prompt_toolkit
+    if name == "custom_style":
+        return _get_style()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Separator line, styled once at import rather than on every header/footer
+_RULE = click.style("─" * 50, fg="white", dim=True)
 
 
 def print_header(title: str, subtitle: str | None = None) -> None:
     """Print a styled header with separator lines."""
-    click.secho("─" * 50, fg="white", dim=True)
+    click.echo(_RULE)
     click.secho(title, fg="cyan", bold=True)
-    click.secho("─" * 50, fg="white", dim=True)
+    click.echo(_RULE)
     if subtitle:
         click.secho(subtitle + "\n", fg="white")
 
 
 def print_success_footer(message: str, location: str | None = None, docs_url: str | None = None) -> None:
     """Print a styled success message with optional location and documentation link."""
-    click.secho("\n" + "─" * 50, fg="white", dim=True)
+    click.echo("\n" + _RULE)
     click.secho(message, fg="green", bold=True)
-    click.secho("─" * 50, fg="white", dim=True)
+    click.echo(_RULE)
 
     if location:
         click.secho(f"\nLocation: {location}", fg="cyan")
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import copy
+import os
+import threading
+from collections import OrderedDict
 from typing import Any
 
 from pydantic import BaseModel, Field, field_validator, model_validator
@@ -241,6 +245,25 @@ class IntentConfig(BaseModel):
         if package_name in self.plugins:
             del self.plugins[package_name]
 
+    def find_mcp_server(self, name: str) -> dict[str, Any] | None:
+        """Return the first configured MCP server entry called ``name``, or None.
+
+        The entry is the stored dict itself, so edits made to it are saved with the configuration.
+        """
+        for server in (self.mcp or {}).get("servers", []):
+            if isinstance(server, dict) and server.get("name") == name:
+                return server
+        return None
+
+    def remove_mcp_server(self, name: str) -> bool:
+        """Remove every MCP server entry called ``name``, returning whether any were removed."""
+        if not self.mcp or "servers" not in self.mcp:
+            return False
+        servers = self.mcp["servers"]
+        remaining = [s for s in servers if not (isinstance(s, dict) and s.get("name") == name)]
+        self.mcp["servers"] = remaining
+        return len(remaining) != len(servers)
+
     def model_dump_yaml_friendly(self) -> dict[str, Any]:
         """
         Export to a YAML-friendly dictionary.
@@ -323,19 +346,57 @@ class IntentConfig(BaseModel):
         return result
 
 
-def load_intent_config(file_path: str) -> IntentConfig:
-    """Load intent configuration from a YAML file."""
-    from pathlib import Path
+# Parsed YAML per resolved path, keyed on the file's stat signature so edits invalidate it
+_PARSED_CONFIG_CACHE: OrderedDict[str, tuple[tuple[int, int, int], dict[str, Any]]] = OrderedDict()
+_PARSED_CONFIG_CACHE_SIZE = 100
+_parsed_config_lock = threading.Lock()
+
 
+def _load_intent_data(path: str) -> dict[str, Any] | None:
+    """Return a private copy of the parsed YAML at ``path``, or None if it doesn't exist.
+
+    The parse is cached in-process until the file's mtime, size or inode changes.
+    """
     import yaml
 
-    path = Path(file_path)
-    if not path.exists():
-        # Return default config if file doesn't exist
-        return IntentConfig(name="AgentUp Agent")
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    key = os.path.realpath(path)
+    signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    with _parsed_config_lock:
+        cached = _PARSED_CONFIG_CACHE.get(key)
+        if cached is not None and cached[0] == signature:
+            _PARSED_CONFIG_CACHE.move_to_end(key)
+            return copy.deepcopy(cached[1])
 
     with open(path) as f:
-        data = yaml.safe_load(f) or {}
+        # libyaml's C parser when PyYAML was built with it
+        data = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or {}  # nosec B506
+
+    with _parsed_config_lock:
+        _PARSED_CONFIG_CACHE[key] = (signature, copy.deepcopy(data))
+        _PARSED_CONFIG_CACHE.move_to_end(key)
+        while len(_PARSED_CONFIG_CACHE) > _PARSED_CONFIG_CACHE_SIZE:
+            _PARSED_CONFIG_CACHE.popitem(last=False)
+
+    return data
+
+
+def _invalidate_intent_data(path: str) -> None:
+    with _parsed_config_lock:
+        _PARSED_CONFIG_CACHE.pop(os.path.realpath(path), None)
+
+
+def load_intent_config(file_path: str) -> IntentConfig:
+    """Load intent configuration from a YAML file."""
+    data = _load_intent_data(file_path)
+    if data is None:
+        # Return default config if file doesn't exist
+        return IntentConfig(name="AgentUp Agent")
 
     # Add API version if missing
     if "apiVersion" not in data:
@@ -445,3 +506,5 @@ def save_intent_config(config: IntentConfig, file_path: str) -> None:
     # Write the formatted content
     with open(path, "w") as f:
         f.write("\n".join(clean_lines))
+
+    _invalidate_intent_data(file_path)
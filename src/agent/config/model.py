@@ -663,12 +663,7 @@ def expand_env_vars(value: Any) -> Any:
         import re
 
         def replace_env_var(match):
-            var_spec = match.group(1)
-            if ":" in var_spec:
-                var_name, default = var_spec.split(":", 1)
-            else:
-                var_name, default = var_spec, None
-
+            var_name, _, default = match.group(1).partition(":")
             return os.getenv(var_name, default or match.group(0))
 
         return re.sub(r"\$\{([^}]+)\}", replace_env_var, value)
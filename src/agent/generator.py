@@ -115,8 +115,7 @@ class ProjectGenerator:
         helm_templates_dir = helm_dir / "templates"
 
         # Create directories
-        helm_dir.mkdir(exist_ok=True)
-        helm_templates_dir.mkdir(exist_ok=True)
+        helm_templates_dir.mkdir(parents=True, exist_ok=True)
 
         # Generate Helm chart files
         helm_files = {
@@ -149,7 +148,6 @@ class ProjectGenerator:
 
     def _copy_weather_server(self):
         """Copy the weather server script to the MCP scripts directory."""
-        import shutil
         from pathlib import Path
 
         # Source path to the weather server (now in utils)
@@ -160,14 +158,17 @@ class ProjectGenerator:
         scripts_dir.mkdir(parents=True, exist_ok=True)
         dest_path = scripts_dir / "weather_server.py"
 
-        # Copy the file
-        if source_path.exists():
-            shutil.copy2(source_path, dest_path)
-            # Make it executable
-            dest_path.chmod(0o755)
-            logger.debug(f"Successfully copied weather server from {source_path} to {dest_path}")
-        else:
+        # Read the source on its own so a missing demo file is not confused with a destination error
+        try:
+            script = source_path.read_bytes()
+        except FileNotFoundError:
             logger.error(f"Source weather server not found at {source_path}")
+            return
+
+        dest_path.write_bytes(script)
+        # Make it executable
+        dest_path.chmod(0o755)
+        logger.debug(f"Successfully copied weather server from {source_path} to {dest_path}")
 
     # ============================================================================
     # TEMPLATE RENDERING
@@ -256,9 +257,10 @@ class ProjectGenerator:
 
     def _build_security_context(self) -> dict[str, Any]:
         auth_enabled = "auth" in self.features
-        auth_type = self.config.get("feature_config", {}).get("auth", DEFAULT_AUTH_TYPE)
-        scope_config = self.config.get("feature_config", {}).get("scope_config", {})
-        oauth2_provider = self.config.get("feature_config", {}).get("oauth2_provider")
+        feature_config = self.config.get("feature_config", {})
+        auth_type = feature_config.get("auth", DEFAULT_AUTH_TYPE)
+        scope_config = feature_config.get("scope_config", {})
+        oauth2_provider = feature_config.get("oauth2_provider")
 
         context = {
             "security_enabled": auth_enabled,
@@ -280,12 +282,10 @@ class ProjectGenerator:
         # Cache backend
         cache_backend = feature_config.get("cache_backend", DEFAULT_CACHE_BACKEND)
 
-        # State backend
-        state_backend = None
-        if "state_backend" in feature_config:
-            state_backend = feature_config["state_backend"]
-        elif "state_management" in self.features:
-            state_backend = DEFAULT_STATE_BACKEND
+        # State backend: explicit choice, else the default when state management is enabled
+        state_backend = feature_config.get(
+            "state_backend", DEFAULT_STATE_BACKEND if "state_management" in self.features else None
+        )
 
         return {
             "cache_backend": cache_backend,
@@ -431,30 +431,32 @@ def timed():
 
 
 def with_middleware(middleware_configs: list[dict[str, Any]]):
-    # Import module logger for consistency
+    # Build the middleware decorators once so the returned decorator can be reused across functions.
+    # Stored in reverse order (last middleware wraps first).
+    middleware_decorators: list[Callable[[Callable], Callable]] = []
+    for config in reversed(middleware_configs):
+        middleware_name = config.get("name")
+        params = config.get("params", {})
+
+        if middleware_name == "rate_limited":
+            rate_config = RateLimitConfig(**params) if params else RateLimitConfig()
+            middleware_decorators.append(rate_limited(rate_config))
+        elif middleware_name == "cached":
+            if params:
+                cache_config = CacheConfig(**params)
+            else:
+                cache_config = get_global_cache_config()
+            middleware_decorators.append(cached(cache_config))
+        elif middleware_name == "retryable":
+            retry_config = RetryConfig(**params) if params else RetryConfig()
+            middleware_decorators.append(retryable(retry_config))
+        elif middleware_name == "timed":
+            middleware_decorators.append(timed())
 
     def decorator(func: Callable) -> Callable:
         wrapped_func = func
-
-        # Apply middleware in reverse order (last middleware wraps first)
-        for config in reversed(middleware_configs):
-            middleware_name = config.get("name")
-            params = config.get("params", {})
-
-            if middleware_name == "rate_limited":
-                rate_config = RateLimitConfig(**params) if params else RateLimitConfig()
-                wrapped_func = rate_limited(rate_config)(wrapped_func)
-            elif middleware_name == "cached":
-                if params:
-                    cache_config = CacheConfig(**params)
-                else:
-                    cache_config = get_global_cache_config()
-                wrapped_func = cached(cache_config)(wrapped_func)
-            elif middleware_name == "retryable":
-                retry_config = RetryConfig(**params) if params else RetryConfig()
-                wrapped_func = retryable(retry_config)(wrapped_func)
-            elif middleware_name == "timed":
-                wrapped_func = timed()(wrapped_func)
+        for middleware_decorator in middleware_decorators:
+            wrapped_func = middleware_decorator(wrapped_func)
 
         # Preserve function attributes
         if hasattr(func, "_is_ai_function"):
@@ -12,6 +12,11 @@ _auth_context: contextvars.ContextVar[AuthenticationResult | None] = contextvars
     "auth_context", default=None
 )
 
+# Context variable caching the most recent capability context per request
+_capability_context: contextvars.ContextVar["CapabilityContext | None"] = contextvars.ContextVar(
+    "capability_context", default=None
+)
+
 
 class AuthContext:
     def __init__(self, auth_result: AuthenticationResult | None):
@@ -178,6 +183,9 @@ def create_capability_context(task: Any, auth_result: AuthenticationResult | Non
     """
     Create a CapabilityContext for a task.
 
+    The context is cached per request, so repeated calls for the same task and
+    authentication result (e.g. nested capability wrappers) reuse one instance.
+
     Args:
         task: The A2A task being processed
         auth_result: Optional authentication result (will use current context if not provided)
@@ -185,7 +193,16 @@ def create_capability_context(task: Any, auth_result: AuthenticationResult | Non
     Returns:
         CapabilityContext: Context object for the capability handler
     """
-    return CapabilityContext(task, auth_result)
+    if auth_result is None:
+        auth_result = get_current_auth()
+
+    context = _capability_context.get()
+    if context is not None and context.task is task and context.auth_result is auth_result:
+        return context
+
+    context = CapabilityContext(task, auth_result)
+    _capability_context.set(context)
+    return context
 
 
 # Logging utilities for security events
@@ -222,7 +239,7 @@ def log_capability_access(
     capability_id: str,
     user_id: str,
     user_scopes: set[str],
-    required_scopes: list[str],
+    required_scopes: list[str] | frozenset[str],
     success: bool,
     execution_time_ms: int = None,
 ):
@@ -237,7 +254,7 @@ def log_capability_access(
         capability_id: ID of the capability being accessed
         user_id: ID of the user making the request
         user_scopes: Set of scopes the user possesses
-        required_scopes: List of scopes required for the capability
+        required_scopes: Scopes required for the capability
         success: Whether the access was successful
         execution_time_ms: Optional execution time in milliseconds
     """
@@ -248,7 +265,7 @@ def log_capability_access(
         "capability_id": capability_id,
         "user_id": user_id,
         "user_scopes": sorted(list(user_scopes)),
-        "required_scopes": required_scopes,
+        "required_scopes": sorted(required_scopes),
         "access_granted": success,
         "scope_check_passed": all(scope in user_scopes for scope in required_scopes),
         "execution_time_ms": execution_time_ms,
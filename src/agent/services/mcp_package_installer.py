@@ -88,11 +88,18 @@ class MCPPackageInstaller:
 
     async def _check_command_available(self, command: str) -> bool:
         """Check if a command is available in the system PATH."""
+        # PATH lookups are remembered for the life of the installer
+        if command in self.installation_cache:
+            return self.installation_cache[command]
+
         try:
             # Use shutil.which for more reliable command detection
-            return shutil.which(command) is not None
+            available = shutil.which(command) is not None
         except (FileNotFoundError, OSError):
-            return False
+            available = False
+
+        self.installation_cache[command] = available
+        return available
 
     async def _pull_docker_image(self, image: str) -> None:
         """Pre-pull a Docker image."""
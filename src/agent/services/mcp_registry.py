@@ -7,13 +7,23 @@ registry API for server discovery and configuration.
 
 from __future__ import annotations
 
+import os
+import time
+from pathlib import Path
 from typing import Any
+from urllib.parse import quote
 
 import httpx
 from pydantic import BaseModel, Field, field_validator
 
 from ..types import ServiceName
 
+# Optional faster JSON decoder for registry payloads
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 
 class RegistryRepository(BaseModel):
     """Repository information for a registry server."""
@@ -70,20 +80,45 @@ class RegistryServer(BaseModel):
     meta: dict[str, Any] = Field(default_factory=dict, alias="_meta", description="Registry metadata")
 
 
-class MCPRegistryClient:
-    """Client for interacting with the MCP registry API."""
+# How long a fetched server entry or listing is reused before asking the registry again
+REGISTRY_CACHE_TTL = 300.0
+
+# Cache key for the full server listing; registry server names are namespaced
+# (``io.github.owner/name``) so this can't collide with a server entry
+_LISTING_CACHE_KEY = "_servers"
+
+
+def _default_cache_dir() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "agentup" / "mcp_registry"
 
-    def __init__(self, base_url: str = "https://registry.modelcontextprotocol.io"):
+
+class MCPRegistryClient:
+    """Client for interacting with the MCP registry API.
+
+    The server listing and the details fetched by ``get_server`` are kept on
+    disk for ``cache_ttl`` seconds, so repeated ``list``/``info``/``add`` runs
+    only hit the registry once. Once the listing expires it is revalidated with
+    its ETag, and a 304 reuses the cached copy. Pass ``use_cache=False`` to
+    always fetch fresh data.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://registry.modelcontextprotocol.io",
+        use_cache: bool = True,
+        cache_dir: Path | None = None,
+        cache_ttl: float = REGISTRY_CACHE_TTL,
+    ):
         self.base_url = base_url.rstrip("/")
         self.client = httpx.AsyncClient(timeout=30.0)
+        self.cache_dir = (cache_dir or _default_cache_dir()) if use_cache else None
+        self.cache_ttl = cache_ttl
 
     async def list_servers(self, search: str | None = None, status: str = "active") -> list[RegistryServer]:
         """List servers from registry with optional filtering."""
         try:
-            response = await self.client.get(f"{self.base_url}/v0/servers")
-            response.raise_for_status()
-
-            data = response.json()
+            data = await self._get_listing()
             servers_data = data.get("servers", [])
             servers = [RegistryServer(**server) for server in servers_data]
 
@@ -103,17 +138,104 @@ class MCPRegistryClient:
         except httpx.HTTPError as e:
             raise MCPRegistryError(f"Failed to list servers: {e}") from e
 
+    async def _get_listing(self) -> Any:
+        """Fetch the raw server listing, revalidating an expired cache entry with its ETag."""
+        listing_path = self._cache_path(_LISTING_CACHE_KEY)
+        data = self._read_cache(listing_path)
+        if data is not None:
+            return data
+
+        etag = self._read_etag(listing_path)
+        headers = {"If-None-Match": etag} if etag else None
+        response = await self.client.get(f"{self.base_url}/v0/servers", headers=headers)
+
+        if response.status_code == 304 and listing_path is not None:
+            data = self._read_cache(listing_path, ignore_ttl=True)
+            if data is not None:
+                # Unchanged upstream; restart the entry's TTL and reuse it
+                self._touch_cache(listing_path)
+                return data
+            response = await self.client.get(f"{self.base_url}/v0/servers")
+
+        response.raise_for_status()
+        self._write_cache(listing_path, response.text, etag=response.headers.get("etag"))
+        return json_loads(response.content)
+
     async def get_server(self, server_id: str) -> RegistryServer:
         """Get full server details including packages."""
+        cache_path = self._cache_path(server_id)
+        server_data = self._read_cache(cache_path)
+        if server_data is not None:
+            try:
+                return RegistryServer.model_validate(server_data)
+            except ValueError:
+                # Entry written by an incompatible version; refetch it
+                pass
+
+        server = await self._fetch_server(server_id)
+        self._write_cache(cache_path, server.model_dump_json(by_alias=True))
+        return server
+
+    def _cache_path(self, key: str) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{quote(key, safe='')}.json"
+
+    def _read_cache(self, cache_path: Path | None, ignore_ttl: bool = False) -> Any | None:
+        if cache_path is None:
+            return None
         try:
-            # First, try to find the server by name to get its UUID
-            servers = await self.list_servers()
-            target_server = None
+            if not ignore_ttl and time.time() - cache_path.stat().st_mtime > self.cache_ttl:
+                return None
+            return json_loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            # Missing, expired or unreadable entry; fall back to the registry
+            return None
+
+    def _read_etag(self, cache_path: Path | None) -> str | None:
+        if cache_path is None:
+            return None
+        try:
+            return cache_path.with_suffix(".etag").read_text(encoding="utf-8") or None
+        except OSError:
+            return None
 
-            for server in servers:
-                if server.name == server_id:
-                    target_server = server
-                    break
+    def _touch_cache(self, cache_path: Path) -> None:
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+
+    def _write_cache(self, cache_path: Path | None, payload: str, etag: str | None = None) -> None:
+        if cache_path is None:
+            return
+        etag_path = cache_path.with_suffix(".etag")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Drop the old validator first so it can never be paired with the new payload
+            etag_path.unlink(missing_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(payload, encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+            if etag:
+                etag_path.write_text(etag, encoding="utf-8")
+        except OSError:
+            # Caching is best effort
+            pass
+
+    async def _fetch_server(self, server_id: str) -> RegistryServer:
+        try:
+            # First, try to find the server by name to get its UUID. Only the matching
+            # active entry is validated, not every server in the listing
+            listing = await self._get_listing()
+            target_server = next(
+                (
+                    RegistryServer(**server)
+                    for server in listing.get("servers", [])
+                    if server.get("name") == server_id and server.get("status") == "active"
+                ),
+                None,
+            )
 
             if not target_server:
                 raise MCPRegistryError(f"Server '{server_id}' not found in registry")
@@ -128,7 +250,7 @@ class MCPRegistryClient:
             response = await self.client.get(f"{self.base_url}/v0/servers/{server_uuid}")
             response.raise_for_status()
 
-            server_data = response.json()
+            server_data = json_loads(response.content)
             return RegistryServer(**server_data)
 
         except httpx.HTTPError as e:
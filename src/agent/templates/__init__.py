@@ -1,16 +1,32 @@
+from collections.abc import Iterable
+from functools import cache
+
 import questionary
 
+# (title, value, checked by default)
+_FEATURES: tuple[tuple[str, str, bool], ...] = (
+    ("Authentication Method (API Key, Bearer(JWT), OAuth2)", "auth", True),
+    ("Context-Aware Middleware (caching, retry, rate limiting)", "middleware", True),
+    ("State Management (conversation persistence)", "state_management", True),
+    ("AI Provider (ollama, openai, anthropic)", "ai_provider", False),
+    ("MCP Integration (Model Context Protocol)", "mcp", True),
+    ("Push Notifications (webhooks)", "push_notifications", False),
+    ("Development Features (filesystem plugins, debug mode)", "development", False),
+    ("Deployment (Kubernetes, Helm Charts)", "deployment", False),
+)
+
+
+@cache
+def get_default_features() -> tuple[str, ...]:
+    return tuple(value for _, value, checked in _FEATURES if checked)
+
+
+def get_feature_choices(selected: Iterable[str] | None = None) -> list[questionary.Choice]:
+    """Build the feature checkbox choices.
 
-def get_feature_choices() -> list[questionary.Choice]:
-    return [
-        questionary.Choice("Authentication Method (API Key, Bearer(JWT), OAuth2)", value="auth", checked=True),
-        questionary.Choice(
-            "Context-Aware Middleware (caching, retry, rate limiting)", value="middleware", checked=True
-        ),
-        questionary.Choice("State Management (conversation persistence)", value="state_management", checked=True),
-        questionary.Choice("AI Provider (ollama, openai, anthropic)", value="ai_provider"),
-        questionary.Choice("MCP Integration (Model Context Protocol)", value="mcp", checked=True),
-        questionary.Choice("Push Notifications (webhooks)", value="push_notifications"),
-        questionary.Choice("Development Features (filesystem plugins, debug mode)", value="development"),
-        questionary.Choice("Deployment (Kubernetes, Helm Charts)", value="deployment"),
-    ]
+    Choices are pre-checked with the defaults unless ``selected`` is given, in which
+    case exactly those features are checked. A fresh list is returned on every call
+    because questionary choices are mutable.
+    """
+    checked = set(get_default_features() if selected is None else selected)
+    return [questionary.Choice(title, value=value, checked=value in checked) for title, value, _ in _FEATURES]
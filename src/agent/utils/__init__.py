@@ -1,4 +1,22 @@
-from .helpers import *  # noqa: F403
-from .messages import *  # noqa: F403
+import importlib
 
 __all__ = []
+
+# Helpers re-exported from submodules; resolved on first access so that importing
+# a lightweight submodule such as agent.utils.version doesn't pull in a2a.types
+_LAZY_EXPORTS = {
+    "TaskValidator": ".helpers",
+    "extract_parameter": ".helpers",
+    "format_response": ".helpers",
+    "sanitize_input": ".helpers",
+    "generate_task_id": ".helpers",
+    "get_timestamp": ".helpers",
+    "MessageProcessor": ".messages",
+    "ConversationContext": ".messages",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,8 @@
 import subprocess  # nosec
 from pathlib import Path
 
+_GIT_INIT_STEPS = (("git", "init"), ("git", "add", "."), ("git", "commit", "-m", "Initial commit"))
+
 
 def get_git_author_info() -> dict[str, str | None]:
     """
@@ -56,14 +58,9 @@ def initialize_git_repo(project_path: Path) -> tuple[bool, str | None]:
         as long as the entry point is the CLI command and the project_path is controlled.
     """
     try:
-        subprocess.run(["git", "--version"], check=True, capture_output=True)  # nosec
-
-        subprocess.run(["git", "init"], cwd=project_path, check=True, capture_output=True)  # nosec
-
-        subprocess.run(["git", "add", "."], cwd=project_path, check=True, capture_output=True)  # nosec
-
-        subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=project_path, check=True, capture_output=True)  # nosec
-
+        # A missing git executable surfaces as FileNotFoundError from the first step
+        for step in _GIT_INIT_STEPS:
+            subprocess.run(step, cwd=project_path, check=True, capture_output=True)  # nosec
         return True, None
 
     except subprocess.CalledProcessError as e:
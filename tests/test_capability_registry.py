@@ -0,0 +1,92 @@
+"""
+Tests for capability registry cache invalidation.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.agent.capabilities import manager
+from src.agent.capabilities.manager import execute_capabilities
+
+
+async def _noop(task):
+    return "ok"
+
+
+@pytest.fixture
+def registry():
+    """The live capability registry, restored after each test."""
+    with patch.dict(manager._capabilities):
+        manager._invalidate_derived_caches()
+        yield manager._capabilities
+    manager._invalidate_derived_caches()
+
+
+async def _listed_ids() -> set[str]:
+    listing = await execute_capabilities(Mock())
+    return {line.removeprefix("- ") for line in listing.splitlines()[1:]}
+
+
+class TestCapabilityRegistryInvalidation:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            lambda registry: registry.__setitem__("added_capability", _noop),
+            lambda registry: registry.setdefault("added_capability", _noop),
+            lambda registry: registry.update(added_capability=_noop),
+            lambda registry: registry.__ior__({"added_capability": _noop}),
+        ],
+        ids=["setitem", "setdefault", "update", "ior"],
+    )
+    async def test_additions_refresh_listing(self, registry, mutate):
+        assert "added_capability" not in await _listed_ids()
+
+        mutate(registry)
+
+        assert "added_capability" in await _listed_ids()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            lambda registry: registry.__delitem__("removed_capability"),
+            lambda registry: registry.pop("removed_capability"),
+            lambda registry: registry.popitem(),
+            lambda registry: registry.clear(),
+        ],
+        ids=["delitem", "pop", "popitem", "clear"],
+    )
+    async def test_removals_refresh_listing(self, registry, mutate):
+        # Inserted last so popitem removes it
+        registry["removed_capability"] = _noop
+        assert "removed_capability" in await _listed_ids()
+
+        mutate(registry)
+
+        assert "removed_capability" not in await _listed_ids()
+
+    @pytest.mark.asyncio
+    async def test_ior_operator_refreshes_listing(self, registry):
+        await _listed_ids()
+
+        manager._capabilities |= {"added_capability": _noop}
+
+        assert manager._capabilities is registry
+        assert "added_capability" in await _listed_ids()
+
+
+class TestApplyAuthToCapability:
+    def test_context_executor_keeps_metadata(self):
+        async def documented(task, context):
+            """Documented capability."""
+            return "ok"
+
+        wrapped = manager._apply_auth_to_capability(documented, "documented")
+
+        assert wrapped is not documented
+        assert wrapped.__name__ == "documented"
+        assert wrapped.__doc__ == "Documented capability."
+        assert wrapped.__module__ == documented.__module__
+        assert wrapped.__wrapped__ is documented
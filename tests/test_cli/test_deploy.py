@@ -0,0 +1,128 @@
+"""Tests for the deploy command."""
+
+import subprocess
+import sys
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from agent.cli.commands.deploy import _TEMPLATES_DIR, _load_agent_config, deploy
+
+
+@pytest.fixture
+def runner():
+    """Create a Click test runner."""
+    return CliRunner()
+
+
+@pytest.fixture
+def agent_project(temp_dir, monkeypatch):
+    """Create a minimal agent project and run the test from inside it."""
+    (temp_dir / "agentup.yml").write_text("agent:\n  name: My Agent\n", encoding="utf-8")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(temp_dir / "cache"))
+    monkeypatch.chdir(temp_dir)
+    return temp_dir
+
+
+class TestDeployCommand:
+    def test_requires_agentup_yml(self, runner, temp_dir, monkeypatch):
+        monkeypatch.chdir(temp_dir)
+
+        result = runner.invoke(deploy, ["--type", "docker"])
+
+        assert result.exit_code == 0
+        assert "No agentup.yml found" in result.output
+
+    def test_docker_files(self, runner, agent_project):
+        result = runner.invoke(deploy, ["--type", "docker", "--port", "9000"])
+
+        assert result.exit_code == 0
+        assert "Deployment files generated successfully" in result.output
+        assert "docker build -t my-agent:latest ." in result.output
+
+        dockerfile = (agent_project / "Dockerfile").read_text()
+        assert "EXPOSE 9000\n" in dockerfile
+        assert dockerfile.endswith('"--port", "9000"]\n')
+
+        compose = yaml.safe_load((agent_project / "docker-compose.yml").read_text())
+        assert compose["services"]["my-agent"]["ports"] == ["9000:9000"]
+        assert (agent_project / ".dockerignore").exists()
+
+    def test_agent_name_is_sanitized_for_kubernetes(self, runner, agent_project):
+        (agent_project / "agentup.yml").write_text("agent:\n  name: Tom's_Agent v2!\n", encoding="utf-8")
+
+        result = runner.invoke(deploy, ["--type", "k8s"])
+
+        assert result.exit_code == 0
+        assert "kubectl get pods -l app=tom-s-agent-v2\n" in result.output
+
+    def test_rerun_leaves_identical_files_untouched(self, runner, agent_project):
+        runner.invoke(deploy, ["--type", "docker"])
+        dockerfile = agent_project / "Dockerfile"
+        mtime = dockerfile.stat().st_mtime_ns
+
+        result = runner.invoke(deploy, ["--type", "docker"])
+
+        assert result.exit_code == 0
+        assert "Unchanged Dockerfile" in result.output
+        assert dockerfile.stat().st_mtime_ns == mtime
+
+        result = runner.invoke(deploy, ["--type", "docker", "--port", "9000"])
+
+        assert "Created Dockerfile" in result.output
+        assert "EXPOSE 9000\n" in dockerfile.read_text()
+
+    def test_k8s_manifests(self, runner, agent_project):
+        result = runner.invoke(deploy, ["--type", "k8s", "--replicas", "3", "--image-tag", "v1"])
+
+        assert result.exit_code == 0
+        k8s_dir = agent_project / "k8s"
+        manifests = {path.name for path in k8s_dir.iterdir()}
+        assert manifests == {"deployment.yaml", "service.yaml", "configmap.yaml", "secret.yaml", "ingress.yaml"}
+
+        deployment = yaml.safe_load((k8s_dir / "deployment.yaml").read_text())
+        assert deployment["metadata"]["name"] == "my-agent"
+        assert deployment["spec"]["replicas"] == 3
+        assert deployment["spec"]["template"]["spec"]["containers"][0]["image"] == "my-agent:v1"
+
+    def test_helm_chart(self, runner, agent_project):
+        result = runner.invoke(deploy, ["--type", "helm", "--port", "7000"])
+
+        assert result.exit_code == 0
+        chart_dir = agent_project / "helm" / "my-agent"
+        chart = yaml.safe_load((chart_dir / "Chart.yaml").read_text())
+        assert chart["name"] == "my-agent"
+
+        values = yaml.safe_load((chart_dir / "values.yaml").read_text())
+        assert values["service"]["port"] == 7000
+
+        # Helm's Go templates are copied verbatim, with only the agent name filled in
+        helpers = (chart_dir / "templates" / "_helpers.tpl").read_text()
+        assert '{{- define "my-agent.fullname" -}}' in helpers
+        service = (chart_dir / "templates" / "service.yaml").read_text()
+        assert "{{ .Values.service.type }}" in service
+
+        source_dir = _TEMPLATES_DIR / "helm" / "templates"
+        for source in source_dir.iterdir():
+            generated = chart_dir / "templates" / source.name
+            assert generated.read_bytes() == source.read_bytes().replace(b"__AGENT_NAME__", b"my-agent")
+
+
+class TestLoadAgentConfig:
+    def test_reads_current_file_each_time(self, agent_project):
+        config_path = agent_project / "agentup.yml"
+
+        assert _load_agent_config(config_path) == {"agent": {"name": "My Agent"}}
+
+        config_path.write_text("agent:\n  name: Renamed Agent\n", encoding="utf-8")
+        assert _load_agent_config(config_path) == {"agent": {"name": "Renamed Agent"}}
+
+
+def test_cli_import_defers_heavy_modules():
+    # Run in a fresh interpreter; this test process has already imported everything
+    deferred = ("jinja2", "a2a.types", "agent.cli.commands.mcp", "agent.cli.commands.plugin")
+    code = f"import sys, agent.cli.main; print([m for m in {deferred!r} if m in sys.modules])"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)  # nosec
+
+    assert result.stdout.strip().splitlines()[-1] == "[]"
@@ -8,6 +8,7 @@ import yaml
 from click.testing import CliRunner
 
 from agent.cli.commands.plugin import list_plugins
+from agent.cli.commands.plugin_info import _to_json
 from agent.plugins.models import CapabilityDefinition, CapabilityType
 
 
@@ -310,3 +311,14 @@ class TestPluginListCommand:
 
                 result = runner.invoke(list_plugins, [])
                 assert result.exit_code == 0
+
+
+def test_json_output_matches_without_orjson():
+    data = {"name": "Café ☕", "tags": ["météo"], "config": {"retries": 3, "ratio": 1.5, "empty": {}}, "extra": None}
+
+    with patch("agent.cli.commands.plugin_info.orjson", None):
+        fallback = _to_json(data)
+
+    assert fallback == _to_json(data)
+    assert "Café ☕" in fallback
+    assert json.loads(fallback) == data
@@ -0,0 +1,33 @@
+"""
+Tests for git repository helpers used by agent project generation.
+"""
+
+import subprocess
+from unittest.mock import patch
+
+from src.agent.utils.git_utils import initialize_git_repo
+
+
+class TestInitializeGitRepo:
+    def test_runs_each_step_directly(self, tmp_path):
+        with patch("src.agent.utils.git_utils.subprocess.run") as mock_run:
+            assert initialize_git_repo(tmp_path) == (True, None)
+
+        assert [call.args[0] for call in mock_run.call_args_list] == [
+            ("git", "init"),
+            ("git", "add", "."),
+            ("git", "commit", "-m", "Initial commit"),
+        ]
+
+    def test_failed_step_is_reported(self, tmp_path):
+        error = subprocess.CalledProcessError(128, ("git", "commit", "-m", "Initial commit"))
+        with patch("src.agent.utils.git_utils.subprocess.run", side_effect=[None, None, error]):
+            success, message = initialize_git_repo(tmp_path)
+
+        assert success is False
+        assert "'commit'" in message
+        assert "exit code 128" in message
+
+    def test_missing_git_is_reported(self, tmp_path):
+        with patch("src.agent.utils.git_utils.subprocess.run", side_effect=FileNotFoundError):
+            assert initialize_git_repo(tmp_path) == (False, "Git not found. Please install Git.")
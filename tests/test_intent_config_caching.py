@@ -0,0 +1,83 @@
+"""Test intent configuration loading, caching and MCP server helpers."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.agent.config.intent import _PARSED_CONFIG_CACHE, IntentConfig, load_intent_config, save_intent_config
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "agentup.yml"
+    path.write_text("name: Cached Agent\nplugins:\n  weather: {}\n")
+    yield str(path)
+    _PARSED_CONFIG_CACHE.clear()
+
+
+class TestIntentConfigCaching:
+    """Test that agentup.yml is only re-parsed when it changes."""
+
+    def test_reuses_parse_for_unchanged_file(self, config_file):
+        first = load_intent_config(config_file)
+
+        with patch("yaml.load") as mock_load:
+            second = load_intent_config(config_file)
+
+        mock_load.assert_not_called()
+        assert second.name == first.name == "Cached Agent"
+        assert "weather" in second.plugins
+
+    def test_loaded_configs_do_not_share_state(self, config_file):
+        first = load_intent_config(config_file)
+        first.remove_plugin("weather")
+
+        assert "weather" in load_intent_config(config_file).plugins
+
+    def test_save_invalidates_cached_parse(self, config_file):
+        config = load_intent_config(config_file)
+        config.name = "Renamed Agent"
+
+        save_intent_config(config, config_file)
+
+        assert load_intent_config(config_file).name == "Renamed Agent"
+
+    def test_missing_file_returns_default(self, tmp_path):
+        assert load_intent_config(str(tmp_path / "missing.yml")).name == "AgentUp Agent"
+
+
+class TestIntentConfigMCPServers:
+    """Test lookup and removal of configured MCP servers by name."""
+
+    def _config(self) -> IntentConfig:
+        return IntentConfig(
+            name="Agent",
+            mcp={
+                "enabled": True,
+                "servers": [{"name": "files", "transport": "stdio"}, "not-a-server", {"name": "git"}],
+            },
+        )
+
+    def test_find_mcp_server_returns_stored_entry(self):
+        config = self._config()
+
+        server = config.find_mcp_server("files")
+        server["enabled"] = False
+
+        assert config.find_mcp_server("git") == {"name": "git"}
+        assert config.find_mcp_server("missing") is None
+        assert config.mcp["servers"][0]["enabled"] is False
+
+    def test_remove_mcp_server(self):
+        config = self._config()
+
+        assert config.remove_mcp_server("files") is True
+        assert config.remove_mcp_server("files") is False
+        assert config.find_mcp_server("files") is None
+        assert config.find_mcp_server("git") is not None
+
+    def test_helpers_without_mcp_section(self):
+        config = IntentConfig(name="Agent")
+
+        assert config.find_mcp_server("files") is None
+        assert config.remove_mcp_server("files") is False
@@ -0,0 +1,119 @@
+"""Test MCP registry listing and server detail caching."""
+
+import os
+import time
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from src.agent.services.mcp_registry import MCPRegistryClient, RegistryServer
+
+
+def _server() -> RegistryServer:
+    return RegistryServer.model_validate(
+        {
+            "name": "io.github.example/weather",
+            "description": "Weather tools",
+            "status": "active",
+            "version": "1.0.0",
+            "repository": {"url": "https://github.com/example/weather", "source": "github"},
+            "$schema": "https://example.com/server.schema.json",
+            "_meta": {"io.modelcontextprotocol.registry/official": {"id": "abc-123"}},
+        }
+    )
+
+
+class TestMCPRegistryCaching:
+    """Test that server details are reused from disk within the TTL."""
+
+    @pytest.mark.asyncio
+    async def test_get_server_reuses_cached_details(self, tmp_path):
+        async with MCPRegistryClient(cache_dir=tmp_path) as client:
+            with patch.object(client, "_fetch_server", AsyncMock(return_value=_server())) as mock_fetch:
+                first = await client.get_server("io.github.example/weather")
+                second = await client.get_server("io.github.example/weather")
+
+        mock_fetch.assert_awaited_once()
+        assert second == first
+        assert second.meta["io.modelcontextprotocol.registry/official"]["id"] == "abc-123"
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refetched(self, tmp_path):
+        async with MCPRegistryClient(cache_dir=tmp_path) as client:
+            with patch.object(client, "_fetch_server", AsyncMock(return_value=_server())) as mock_fetch:
+                await client.get_server("io.github.example/weather")
+
+                stale = time.time() - client.cache_ttl - 1
+                for cache_file in tmp_path.iterdir():
+                    os.utime(cache_file, (stale, stale))
+
+                await client.get_server("io.github.example/weather")
+
+        assert mock_fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_can_be_disabled(self, tmp_path):
+        async with MCPRegistryClient(use_cache=False, cache_dir=tmp_path) as client:
+            with patch.object(client, "_fetch_server", AsyncMock(return_value=_server())) as mock_fetch:
+                await client.get_server("io.github.example/weather")
+                await client.get_server("io.github.example/weather")
+
+        assert mock_fetch.await_count == 2
+        assert not any(tmp_path.iterdir())
+
+    @pytest.mark.asyncio
+    async def test_list_servers_reuses_cached_listing(self, tmp_path):
+        response = httpx.Response(
+            200,
+            json={"servers": [_server().model_dump(by_alias=True)]},
+            request=httpx.Request("GET", "https://registry.example/v0/servers"),
+        )
+
+        async with MCPRegistryClient(cache_dir=tmp_path) as client:
+            with patch.object(client.client, "get", AsyncMock(return_value=response)) as mock_get:
+                first = await client.list_servers()
+                second = await client.list_servers(search="weather")
+
+        mock_get.assert_awaited_once()
+        assert [s.name for s in first] == [s.name for s in second] == ["io.github.example/weather"]
+
+    @pytest.mark.asyncio
+    async def test_expired_listing_is_revalidated_with_etag(self, tmp_path):
+        request = httpx.Request("GET", "https://registry.example/v0/servers")
+        listing = httpx.Response(
+            200, json={"servers": [_server().model_dump(by_alias=True)]}, headers={"ETag": '"v1"'}, request=request
+        )
+        not_modified = httpx.Response(304, request=request)
+
+        async with MCPRegistryClient(cache_dir=tmp_path) as client:
+            with patch.object(client.client, "get", AsyncMock(side_effect=[listing, not_modified])) as mock_get:
+                await client.list_servers()
+
+                stale = time.time() - client.cache_ttl - 1
+                for cache_file in tmp_path.iterdir():
+                    os.utime(cache_file, (stale, stale))
+
+                servers = await client.list_servers()
+
+        assert mock_get.await_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert [s.name for s in servers] == ["io.github.example/weather"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_server_resolves_uuid_from_listing(self, tmp_path):
+        server = _server().model_dump(by_alias=True)
+        listing = httpx.Response(
+            200,
+            json={"servers": [{**server, "name": "io.github.example/other"}, server]},
+            request=httpx.Request("GET", "https://registry.example/v0/servers"),
+        )
+        details = httpx.Response(
+            200, json=server, request=httpx.Request("GET", "https://registry.example/v0/servers/1")
+        )
+
+        async with MCPRegistryClient(cache_dir=tmp_path) as client:
+            with patch.object(client.client, "get", AsyncMock(side_effect=[listing, details])) as mock_get:
+                result = await client.get_server("io.github.example/weather")
+
+        assert mock_get.await_args.args[0].endswith("/v0/servers/abc-123")
+        assert result.name == "io.github.example/weather"
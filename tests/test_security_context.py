@@ -0,0 +1,88 @@
+"""
+Tests for AgentUp security request context helpers.
+"""
+
+import contextvars
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.agent.security.base import AuthenticationResult
+from src.agent.security.context import AuthContext, create_capability_context, log_capability_access
+
+
+class TestCreateCapabilityContext:
+    def test_reuses_context_for_same_task_and_auth(self):
+        def run():
+            task = Mock()
+            auth_result = AuthenticationResult(success=True, user_id="user-1", scopes={"api:read"})
+
+            first = create_capability_context(task, auth_result)
+            second = create_capability_context(task, auth_result)
+
+            assert first is second
+            assert second.user_id == "user-1"
+            assert second.user_scopes == {"api:read"}
+
+        contextvars.copy_context().run(run)
+
+    def test_new_context_for_different_task(self):
+        def run():
+            auth_result = AuthenticationResult(success=True, user_id="user-1")
+
+            first = create_capability_context(Mock(), auth_result)
+            second = create_capability_context(Mock(), auth_result)
+
+            assert first is not second
+
+        contextvars.copy_context().run(run)
+
+    def test_new_context_when_auth_changes(self):
+        def run():
+            task = Mock()
+            first_auth = AuthenticationResult(success=True, user_id="user-1", scopes={"api:read"})
+            second_auth = AuthenticationResult(success=True, user_id="user-2", scopes={"api:write"})
+
+            with AuthContext(first_auth):
+                first = create_capability_context(task)
+            with AuthContext(second_auth):
+                second = create_capability_context(task)
+
+            assert first is not second
+            assert first.user_id == "user-1"
+            assert second.user_id == "user-2"
+            assert second.user_scopes == {"api:write"}
+
+        contextvars.copy_context().run(run)
+
+
+class TestCapabilityAuditLog:
+    def _log_access(self, success: bool):
+        log_capability_access(
+            capability_id="test_capability",
+            user_id="user-1",
+            user_scopes={"api:read"},
+            required_scopes=frozenset({"api:read"}),
+            success=success,
+        )
+
+    def test_granted_access_is_logged(self):
+        with patch("src.agent.security.context.logger") as mock_logger:
+            self._log_access(success=True)
+
+        mock_logger.info.assert_called_once()
+        assert "access granted" in mock_logger.info.call_args[0][0]
+
+    @pytest.mark.asyncio
+    async def test_granted_access_is_logged_inline_in_request(self):
+        # Written on the request itself, so the record carries that request's contextvars
+        with patch("src.agent.security.context.logger") as mock_logger:
+            self._log_access(success=True)
+            mock_logger.info.assert_called_once()
+
+    def test_denied_access_is_logged(self):
+        with patch("src.agent.security.context.logger") as mock_logger:
+            self._log_access(success=False)
+
+        mock_logger.warning.assert_called_once()
+        assert "access denied" in mock_logger.warning.call_args[0][0]